@@ -2,35 +2,43 @@ import { Injectable, CanActivate, ExecutionContext, Logger } from '@nestjs/commo
 import { ConfigService } from '@nestjs/config';
 import { Observable } from 'rxjs';
 
+// Node lowercases incoming header names
+const API_KEY_HEADER = 'x-api-key';
+
 /**
  * API Key Guard
  * Protects routes by requiring a valid API key in the request headers
+ * Not applied to any route yet; add @UseGuards(ApiKeyGuard) to enable it
  */
 @Injectable()
 export class ApiKeyGuard implements CanActivate {
   private readonly logger = new Logger(ApiKeyGuard.name);
-  private readonly apiKeyHeader = 'X-API-Key';
+  // Valid keys, resolved from config once instead of on every request
+  private readonly validApiKeys: ReadonlySet<string>;
+
+  constructor(private readonly configService: ConfigService) {
+    const apiKeys = this.configService.get<string[] | string>('API_KEYS') || [];
+    const keys = Array.isArray(apiKeys) ? [...apiKeys] : apiKeys.split(',');
 
-  constructor(private readonly configService: ConfigService) {}
+    // Also accept single API_KEY for backwards compatibility
+    const singleApiKey = this.configService.get<string>('API_KEY');
+    if (singleApiKey) {
+      keys.push(singleApiKey);
+    }
+
+    this.validApiKeys = new Set(keys.map((key) => key.trim()).filter(Boolean));
+  }
 
   canActivate(context: ExecutionContext): boolean | Promise<boolean> | Observable<boolean> {
     const request = context.switchToHttp().getRequest();
-    const apiKey = request.headers[this.apiKeyHeader.toLowerCase()] || request.query.apiKey;
+    const apiKey = request.headers[API_KEY_HEADER] || request.query.apiKey;
 
     if (!apiKey) {
       this.logger.warn(`Missing API key for ${request.method} ${request.url}`);
       return false;
     }
 
-    const validApiKeys = this.configService.get<string[]>('API_KEYS') || [];
-    
-    // Also check single API_KEY for backwards compatibility
-    const singleApiKey = this.configService.get<string>('API_KEY');
-    if (singleApiKey) {
-      validApiKeys.push(singleApiKey);
-    }
-
-    const isValid = validApiKeys.includes(apiKey);
+    const isValid = this.validApiKeys.has(apiKey);
 
     if (!isValid) {
       this.logger.warn(`Invalid API key for ${request.method} ${request.url}`);
@@ -1 +1,2 @@
-// Placeholder file
+export { LoggerMiddleware } from './logger.middleware';
+export { JsonCompressionMiddleware } from './json-compression.middleware';
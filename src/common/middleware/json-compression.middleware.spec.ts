@@ -0,0 +1,79 @@
+import { Request, Response } from 'express';
+import { gunzipSync } from 'zlib';
+import { JsonCompressionMiddleware } from './json-compression.middleware';
+
+/**
+ * Response double recording headers; resolves `sent` with the body passed to send()
+ */
+function createResponse() {
+  const headers: Record<string, string> = {};
+  let resolveSent: (body: unknown) => void;
+  const sent = new Promise<unknown>((resolve) => (resolveSent = resolve));
+
+  const res = {
+    headers,
+    sent,
+    get: jest.fn((name: string) => headers[name.toLowerCase()]),
+    type: jest.fn(() => {
+      headers['content-type'] = 'application/json; charset=utf-8';
+      return res;
+    }),
+    vary: jest.fn((field: string) => {
+      headers['vary'] = field;
+      return res;
+    }),
+    setHeader: jest.fn((name: string, value: string) => {
+      headers[name.toLowerCase()] = value;
+    }),
+    send: jest.fn((body: unknown) => {
+      resolveSent(body);
+      return res;
+    }),
+    json: jest.fn(),
+  };
+
+  return res;
+}
+
+describe('JsonCompressionMiddleware', () => {
+  const middleware = new JsonCompressionMiddleware();
+  const largeBody = { items: Array.from({ length: 200 }, (_, index) => ({ id: index })) };
+
+  function respond(acceptEncoding: string | undefined, body: unknown) {
+    const req = { headers: acceptEncoding ? { 'accept-encoding': acceptEncoding } : {} };
+    const res = createResponse();
+    const next = jest.fn();
+
+    middleware.use(req as unknown as Request, res as unknown as Response, next);
+    expect(next).toHaveBeenCalledTimes(1);
+    (res as unknown as Response).json(body);
+
+    return res;
+  }
+
+  it('should send bodies under 1 KB as plain JSON without Vary', async () => {
+    const res = respond('gzip, deflate', { ok: true });
+
+    await expect(res.sent).resolves.toBe('{"ok":true}');
+    expect(res.headers['content-encoding']).toBeUndefined();
+    expect(res.headers['vary']).toBeUndefined();
+    expect(res.headers['content-type']).toContain('application/json');
+  });
+
+  it('should gzip larger bodies for clients that accept gzip', async () => {
+    const res = respond('gzip, deflate, br', largeBody);
+
+    const sent = (await res.sent) as Buffer;
+    expect(res.headers['content-encoding']).toBe('gzip');
+    expect(res.headers['vary']).toBe('Accept-Encoding');
+    expect(JSON.parse(gunzipSync(sent).toString())).toEqual(largeBody);
+  });
+
+  it('should send larger bodies uncompressed but with Vary to other clients', async () => {
+    const res = respond(undefined, largeBody);
+
+    await expect(res.sent).resolves.toBe(JSON.stringify(largeBody));
+    expect(res.headers['content-encoding']).toBeUndefined();
+    expect(res.headers['vary']).toBe('Accept-Encoding');
+  });
+});
@@ -0,0 +1,55 @@
+import { Injectable, NestMiddleware } from '@nestjs/common';
+import { Request, Response, NextFunction } from 'express';
+import { gzip } from 'zlib';
+
+// Smaller bodies fit in a single packet, so gzip would only add CPU and headers
+const MIN_COMPRESS_BYTES = 1024;
+const GZIP_OPTIONS = { level: 5 };
+const ACCEPTS_GZIP = /\bgzip\b/i;
+
+/**
+ * JSON Compression Middleware
+ * Gzips JSON responses of 1 KB or more for clients that accept it, using the
+ * built-in zlib on its thread pool. Only res.json is wrapped, so Server-Sent
+ * Events and static files are written as before
+ * Bodies are serialized with plain JSON.stringify: Express's "json replacer",
+ * "json spaces" and "json escape" settings are not applied (the app sets none)
+ */
+@Injectable()
+export class JsonCompressionMiddleware implements NestMiddleware {
+  use(request: Request, response: Response, next: NextFunction): void {
+    const acceptsGzip = ACCEPTS_GZIP.test(request.headers['accept-encoding'] || '');
+
+    response.json = ((body: unknown) => {
+      const payload = JSON.stringify(body);
+      if (!response.get('Content-Type')) {
+        response.type('json');
+      }
+
+      if (payload === undefined || Buffer.byteLength(payload) < MIN_COMPRESS_BYTES) {
+        return response.send(payload);
+      }
+
+      // From this size on the encoding depends on Accept-Encoding, so shared caches
+      // must key on it whichever variant this client gets
+      response.vary('Accept-Encoding');
+      if (!acceptsGzip) {
+        return response.send(payload);
+      }
+
+      gzip(payload, GZIP_OPTIONS, (error, compressed) => {
+        if (error) {
+          response.send(payload);
+          return;
+        }
+
+        response.setHeader('Content-Encoding', 'gzip');
+        response.send(compressed);
+      });
+
+      return response;
+    }) as Response['json'];
+
+    next();
+  }
+}
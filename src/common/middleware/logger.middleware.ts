@@ -3,24 +3,21 @@ import { Request, Response, NextFunction } from 'express';
 
 /**
  * Logger Middleware
- * Logs all HTTP requests with method, URL, and timing information
+ * Logs each HTTP request once it has finished, with method, path, status and timing
+ * Installed as plain Express middleware, so a request only pays for one listener
  */
 @Injectable()
 export class LoggerMiddleware implements NestMiddleware {
   private readonly logger = new Logger('HTTP');
 
   use(request: Request, response: Response, next: NextFunction): void {
-    const { method, originalUrl } = request;
-    const startTime = Date.now();
+    const startTime = process.hrtime.bigint();
 
-    // Log request
-    this.logger.log(`${method} ${originalUrl}`);
-
-    // Log response on finish
-    response.on('finish', () => {
-      const { statusCode } = response;
-      const duration = Date.now() - startTime;
-      this.logger.log(`${method} ${originalUrl} ${statusCode} ${duration}ms`);
+    response.once('finish', () => {
+      const duration = Number(process.hrtime.bigint() - startTime) / 1e6;
+      this.logger.log(
+        `${request.method} ${request.originalUrl} ${response.statusCode} ${duration.toFixed(1)}ms`,
+      );
     });
 
     next();
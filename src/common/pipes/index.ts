@@ -1 +1,2 @@
-// Placeholder file
+export { ParseIntPipe } from './parse-int.pipe';
+export { createValidationPipe } from './validation.pipe';
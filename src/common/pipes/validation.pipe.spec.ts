@@ -0,0 +1,43 @@
+import { ArgumentMetadata, BadRequestException } from '@nestjs/common';
+import { createValidationPipe } from './validation.pipe';
+import { DirectionsQueryDto, SearchPlacesDto, TravelMode } from '../../modules/maps/dto';
+
+describe('createValidationPipe', () => {
+  const pipe = createValidationPipe();
+  const query = (metatype: ArgumentMetadata['metatype']): ArgumentMetadata => ({
+    type: 'query',
+    metatype,
+  });
+
+  it('should convert numeric query strings to numbers', async () => {
+    const dto = await pipe.transform(
+      { query: 'cafe', latitude: '52.52', radius: '3000' },
+      query(SearchPlacesDto),
+    );
+
+    expect(dto).toBeInstanceOf(SearchPlacesDto);
+    expect(dto).toMatchObject({ latitude: 52.52, radius: 3000, source: 'osm' });
+  });
+
+  it('should split comma-separated waypoints and apply defaults', async () => {
+    const dto = await pipe.transform(
+      { origin: 'Berlin', destination: 'Hamburg', waypoints: 'Potsdam, Schwerin' },
+      query(DirectionsQueryDto),
+    );
+
+    expect(dto.waypoints).toEqual(['Potsdam', 'Schwerin']);
+    expect(dto.mode).toBe(TravelMode.DRIVING);
+  });
+
+  it('should reject values outside the DTO constraints', async () => {
+    await expect(
+      pipe.transform({ query: 'cafe', radius: '60000' }, query(SearchPlacesDto)),
+    ).rejects.toBeInstanceOf(BadRequestException);
+    await expect(
+      pipe.transform(
+        { origin: 'Berlin', destination: 'Hamburg', mode: 'teleport' },
+        query(DirectionsQueryDto),
+      ),
+    ).rejects.toBeInstanceOf(BadRequestException);
+  });
+});
@@ -0,0 +1,15 @@
+import { ValidationPipe } from '@nestjs/common';
+
+/**
+ * Validation pipe used for every request DTO
+ * Payloads are transformed into their DTO classes with implicit conversion, so
+ * numeric query parameters arrive as numbers and @Transform hooks run; error
+ * objects omit the target and value to keep 400 responses small
+ */
+export function createValidationPipe(): ValidationPipe {
+  return new ValidationPipe({
+    transform: true,
+    transformOptions: { enableImplicitConversion: true },
+    validationError: { target: false, value: false },
+  });
+}
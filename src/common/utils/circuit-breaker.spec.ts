@@ -0,0 +1,69 @@
+import { CircuitBreaker, CircuitOpenError } from './circuit-breaker';
+
+describe('CircuitBreaker', () => {
+  const fail = () => Promise.reject(new Error('boom'));
+
+  let breaker: CircuitBreaker;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    breaker = new CircuitBreaker('test', { failureThreshold: 2, resetTimeoutMs: 1000 });
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  async function open(): Promise<void> {
+    await expect(breaker.execute(fail)).rejects.toThrow('boom');
+    await expect(breaker.execute(fail)).rejects.toThrow('boom');
+  }
+
+  it('should open after consecutive failures and reject without calling', async () => {
+    await open();
+    const call = jest.fn().mockResolvedValue('ok');
+
+    expect(breaker.getState()).toBe('open');
+    await expect(breaker.execute(call)).rejects.toBeInstanceOf(CircuitOpenError);
+    expect(call).not.toHaveBeenCalled();
+  });
+
+  it('should reset the failure count after a success', async () => {
+    await expect(breaker.execute(fail)).rejects.toThrow('boom');
+    await expect(breaker.execute(() => Promise.resolve('ok'))).resolves.toBe('ok');
+    await expect(breaker.execute(fail)).rejects.toThrow('boom');
+
+    expect(breaker.getState()).toBe('closed');
+  });
+
+  it('should let a single probe through once the reset timeout has passed', async () => {
+    await open();
+    jest.advanceTimersByTime(1000);
+
+    let resolveProbe: (value: string) => void;
+    const probe = breaker.execute(
+      () => new Promise<string>((resolve) => (resolveProbe = resolve)),
+    );
+
+    expect(breaker.getState()).toBe('half-open');
+    await expect(breaker.execute(() => Promise.resolve('ok'))).rejects.toBeInstanceOf(
+      CircuitOpenError,
+    );
+
+    resolveProbe('ok');
+    await expect(probe).resolves.toBe('ok');
+    expect(breaker.getState()).toBe('closed');
+  });
+
+  it('should reopen when the probe fails', async () => {
+    await open();
+    jest.advanceTimersByTime(1000);
+
+    await expect(breaker.execute(fail)).rejects.toThrow('boom');
+
+    expect(breaker.getState()).toBe('open');
+    await expect(breaker.execute(() => Promise.resolve('ok'))).rejects.toBeInstanceOf(
+      CircuitOpenError,
+    );
+  });
+});
@@ -0,0 +1,70 @@
+export type CircuitState = 'closed' | 'open' | 'half-open';
+
+export interface CircuitBreakerOptions {
+  failureThreshold?: number; // consecutive failures before opening
+  resetTimeoutMs?: number; // how long to stay open before a probe is allowed
+}
+
+/**
+ * Error thrown when a call is rejected because the circuit is open
+ */
+export class CircuitOpenError extends Error {
+  constructor(name: string) {
+    super(`Circuit "${name}" is open`);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+/**
+ * Minimal circuit breaker for calls to external dependencies
+ * Opens after N consecutive failures and fails fast until a single
+ * half-open probe succeeds after the reset timeout
+ */
+export class CircuitBreaker {
+  private state: CircuitState = 'closed';
+  private failures = 0;
+  private openedAt = 0;
+  private readonly failureThreshold: number;
+  private readonly resetTimeoutMs: number;
+
+  constructor(
+    private readonly name: string,
+    options: CircuitBreakerOptions = {},
+  ) {
+    this.failureThreshold = options.failureThreshold ?? 5;
+    this.resetTimeoutMs = options.resetTimeoutMs ?? 30000;
+  }
+
+  getState(): CircuitState {
+    return this.state;
+  }
+
+  /**
+   * Run the call through the breaker, rejecting immediately while open
+   */
+  async execute<T>(call: () => Promise<T>): Promise<T> {
+    if (this.state === 'open') {
+      if (Date.now() - this.openedAt < this.resetTimeoutMs) {
+        throw new CircuitOpenError(this.name);
+      }
+      this.state = 'half-open';
+    } else if (this.state === 'half-open') {
+      // A probe is already in flight
+      throw new CircuitOpenError(this.name);
+    }
+
+    try {
+      const result = await call();
+      this.state = 'closed';
+      this.failures = 0;
+      return result;
+    } catch (error) {
+      this.failures++;
+      if (this.state === 'half-open' || this.failures >= this.failureThreshold) {
+        this.state = 'open';
+        this.openedAt = Date.now();
+      }
+      throw error;
+    }
+  }
+}
@@ -0,0 +1,39 @@
+import { DeferredConsoleLogger } from './deferred-console-logger';
+
+describe('DeferredConsoleLogger', () => {
+  let stdoutWrite: jest.SpyInstance;
+  let stderrWrite: jest.SpyInstance;
+
+  beforeEach(() => {
+    stdoutWrite = jest.spyOn(process.stdout, 'write').mockImplementation(() => true);
+    stderrWrite = jest.spyOn(process.stderr, 'write').mockImplementation(() => true);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should write queued records on the next event-loop turn', async () => {
+    const logger = new DeferredConsoleLogger('Test');
+    logger.log('first');
+    logger.warn('second');
+
+    expect(stdoutWrite).not.toHaveBeenCalled();
+
+    await new Promise((resolve) => setImmediate(resolve));
+
+    expect(stdoutWrite).toHaveBeenCalledTimes(2);
+    expect(String(stdoutWrite.mock.calls[0][0])).toContain('first');
+    expect(String(stdoutWrite.mock.calls[1][0])).toContain('second');
+  });
+
+  it('should write errors immediately after anything already queued', () => {
+    const logger = new DeferredConsoleLogger('Test');
+    logger.log('queued');
+    logger.error('failed');
+
+    expect(stdoutWrite).toHaveBeenCalledTimes(1);
+    expect(String(stdoutWrite.mock.calls[0][0])).toContain('queued');
+    expect(String(stderrWrite.mock.calls[0][0])).toContain('failed');
+  });
+});
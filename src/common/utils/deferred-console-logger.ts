@@ -0,0 +1,47 @@
+import { ConsoleLogger, LogLevel } from '@nestjs/common';
+
+// Levels written straight away: they often precede a crash, so must not sit in the queue
+const IMMEDIATE_LEVELS: ReadonlySet<LogLevel> = new Set<LogLevel>(['error', 'fatal']);
+
+/**
+ * Console logger that queues records and writes them in one batch on the next
+ * turn of the event loop
+ * stdout writes to pipes and files are synchronous in Node, so formatting and
+ * writing inline stalls the request that logged; here a log call only queues
+ */
+export class DeferredConsoleLogger extends ConsoleLogger {
+  private pending: Array<() => void> = [];
+  private flushScheduled = false;
+
+  protected printMessages(
+    messages: unknown[],
+    context?: string,
+    logLevel?: LogLevel,
+    writeStreamType?: 'stdout' | 'stderr',
+  ): void {
+    if (IMMEDIATE_LEVELS.has(logLevel)) {
+      this.flush();
+      super.printMessages(messages, context, logLevel, writeStreamType);
+      return;
+    }
+
+    this.pending.push(() => super.printMessages(messages, context, logLevel, writeStreamType));
+    if (!this.flushScheduled) {
+      this.flushScheduled = true;
+      setImmediate(() => this.flush());
+    }
+  }
+
+  /**
+   * Write every queued record now, in the order they were logged
+   */
+  flush(): void {
+    const pending = this.pending;
+    this.pending = [];
+    this.flushScheduled = false;
+
+    for (const print of pending) {
+      print();
+    }
+  }
+}
@@ -0,0 +1,55 @@
+import { lowerBound, parseLatLng } from './helpers';
+
+describe('helpers', () => {
+  describe('lowerBound', () => {
+    const values = new Float64Array([100, 200, 200, 300]);
+
+    it('should return the first index whose value is not below the target', () => {
+      expect(lowerBound(values, 150)).toBe(1);
+      expect(lowerBound(values, 250)).toBe(3);
+    });
+
+    it('should return the first of several equal values', () => {
+      expect(lowerBound(values, 200)).toBe(1);
+    });
+
+    it('should return 0 when the target is at or below the first value', () => {
+      expect(lowerBound(values, 100)).toBe(0);
+      expect(lowerBound(values, -1)).toBe(0);
+    });
+
+    it('should return the length when every value is below the target', () => {
+      expect(lowerBound(values, 300.5)).toBe(values.length);
+    });
+
+    it('should return 0 for an empty array', () => {
+      expect(lowerBound([], 10)).toBe(0);
+    });
+  });
+
+  describe('parseLatLng', () => {
+    it('should parse a "lat,lng" pair', () => {
+      expect(parseLatLng('52.52,13.405')).toEqual({ latitude: 52.52, longitude: 13.405 });
+    });
+
+    it('should allow whitespace, negative values and integers', () => {
+      expect(parseLatLng(' -33.8688 , 151 ')).toEqual({ latitude: -33.8688, longitude: 151 });
+    });
+
+    it('should accept the coordinate range limits', () => {
+      expect(parseLatLng('-90,180')).toEqual({ latitude: -90, longitude: 180 });
+    });
+
+    it('should reject coordinates out of range', () => {
+      expect(parseLatLng('91,0')).toBeNull();
+      expect(parseLatLng('0,180.5')).toBeNull();
+    });
+
+    it('should reject addresses and partial pairs', () => {
+      expect(parseLatLng('Berlin, Germany')).toBeNull();
+      expect(parseLatLng('10 Downing Street, London')).toBeNull();
+      expect(parseLatLng('52.52')).toBeNull();
+      expect(parseLatLng('52.52,13.405,7')).toBeNull();
+    });
+  });
+});
@@ -90,3 +90,58 @@ export function formatDistance(meters: number): string {
 export function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
+
+/**
+ * Returns the index of the first element in an ascending array that is >= target,
+ * or the array length if there is none
+ */
+export function lowerBound(values: ArrayLike<number>, target: number): number {
+  let low = 0;
+  let high = values.length;
+
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (values[mid] < target) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+
+  return low;
+}
+
+// "lat,lng" pair such as "52.5200, 13.4050"
+const LAT_LNG_PATTERN = /^\s*(-?\d{1,2}(?:\.\d+)?)\s*,\s*(-?\d{1,3}(?:\.\d+)?)\s*$/;
+
+/**
+ * Parses a "lat,lng" string into coordinates, or returns null if the string is
+ * not a valid coordinate pair (e.g. it is an address that needs geocoding)
+ */
+export function parseLatLng(value: string): { latitude: number; longitude: number } | null {
+  const match = LAT_LNG_PATTERN.exec(value);
+  if (!match) {
+    return null;
+  }
+
+  const latitude = Number(match[1]);
+  const longitude = Number(match[2]);
+  if (Math.abs(latitude) > 90 || Math.abs(longitude) > 180) {
+    return null;
+  }
+
+  return { latitude, longitude };
+}
+
+// Markdown code fence around an LLM's JSON answer, e.g. ```json ... ```
+const JSON_FENCE_PATTERN = /```(?:json)?\s*([\s\S]*?)```/;
+
+/**
+ * Parses JSON from an LLM response, unwrapping a markdown code block if present
+ */
+export function extractJson<T = any>(content: string): T {
+  const fenceMatch = JSON_FENCE_PATTERN.exec(content);
+  const jsonContent = fenceMatch ? fenceMatch[1].trim() : content;
+
+  return JSON.parse(jsonContent) as T;
+}
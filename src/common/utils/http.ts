@@ -0,0 +1,32 @@
+import * as http from 'http';
+import * as https from 'https';
+import axios, { AxiosInstance, CreateAxiosDefaults } from 'axios';
+
+// Shared agent settings: LIFO scheduling keeps concurrent bursts on the few most
+// recently used (already warm) sockets and lets the rest idle out, approximating
+// HTTP/2-style connection reuse, which axios does not speak
+const AGENT_OPTIONS: http.AgentOptions = {
+  keepAlive: true,
+  keepAliveMsecs: 30000,
+  maxSockets: 100,
+  maxFreeSockets: 20,
+  scheduling: 'lifo',
+};
+
+// Process-wide keep-alive agents so outbound calls reuse TCP/TLS connections
+export const httpAgent = new http.Agent(AGENT_OPTIONS);
+export const httpsAgent = new https.Agent(AGENT_OPTIONS);
+
+const DEFAULT_TIMEOUT_MS = 30000;
+
+/**
+ * Create an axios instance backed by the shared keep-alive agents
+ */
+export function createHttpClient(config: CreateAxiosDefaults = {}): AxiosInstance {
+  return axios.create({
+    timeout: DEFAULT_TIMEOUT_MS,
+    httpAgent,
+    httpsAgent,
+    ...config,
+  });
+}
@@ -1,8 +1,16 @@
 export { logger } from './logger';
+export { DeferredConsoleLogger } from './deferred-console-logger';
 export {
   decodePolyline,
   calculateDistance,
   formatDuration,
   formatDistance,
   sleep,
+  lowerBound,
+  parseLatLng,
+  extractJson,
 } from './helpers';
+export { getSharedChatOpenAI, getSharedChatDeepSeek } from './llm';
+export { TtlCache } from './ttl-cache';
+export { createHttpClient, httpAgent, httpsAgent } from './http';
+export { CircuitBreaker, CircuitOpenError } from './circuit-breaker';
@@ -0,0 +1,58 @@
+import { ChatOpenAI } from '@langchain/openai';
+import { ChatDeepSeek } from '@langchain/deepseek';
+
+const DEEPSEEK_BASE_URL = 'https://api.deepseek.com';
+
+// Shared chat model clients keyed by api key, model and temperature
+const chatOpenAIClients = new Map<string, ChatOpenAI>();
+const chatDeepSeekClients = new Map<string, ChatDeepSeek>();
+
+/**
+ * Returns a process-wide ChatOpenAI client (pointed at DeepSeek) for the given settings,
+ * so every agent and repository using the same model shares one connection pool
+ */
+export function getSharedChatOpenAI(
+  apiKey: string,
+  modelName: string,
+  temperature: number,
+): ChatOpenAI {
+  const key = `${apiKey}|${modelName}|${temperature}`;
+  let client = chatOpenAIClients.get(key);
+
+  if (!client) {
+    client = new ChatOpenAI({
+      openAIApiKey: apiKey,
+      modelName,
+      temperature,
+      configuration: {
+        baseURL: DEEPSEEK_BASE_URL,
+      },
+    });
+    chatOpenAIClients.set(key, client);
+  }
+
+  return client;
+}
+
+/**
+ * Returns a process-wide ChatDeepSeek client for the given settings
+ */
+export function getSharedChatDeepSeek(
+  apiKey: string,
+  model: string,
+  temperature: number,
+): ChatDeepSeek {
+  const key = `${apiKey}|${model}|${temperature}`;
+  let client = chatDeepSeekClients.get(key);
+
+  if (!client) {
+    client = new ChatDeepSeek({
+      apiKey,
+      model,
+      temperature,
+    });
+    chatDeepSeekClients.set(key, client);
+  }
+
+  return client;
+}
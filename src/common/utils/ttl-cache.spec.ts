@@ -0,0 +1,81 @@
+import { TtlCache } from './ttl-cache';
+
+describe('TtlCache', () => {
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('should return stored values', () => {
+    const cache = new TtlCache<string, number>(1000);
+    cache.set('a', 1);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+  });
+
+  it('should expire entries after the ttl', () => {
+    jest.useFakeTimers();
+    const cache = new TtlCache<string, number>(1000);
+    cache.set('a', 1);
+
+    jest.advanceTimersByTime(1001);
+
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+
+  it('should evict the least recently used entry when full', () => {
+    const cache = new TtlCache<string, number>(1000, 2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('c')).toBe(3);
+  });
+
+  describe('getOrCreate', () => {
+    it('should share one pending call between concurrent callers', async () => {
+      const cache = new TtlCache<string, Promise<number>>(1000);
+      const factory = jest.fn().mockResolvedValue(1);
+
+      const [first, second] = await Promise.all([
+        cache.getOrCreate('a', factory),
+        cache.getOrCreate('a', factory),
+      ]);
+
+      expect(first).toBe(1);
+      expect(second).toBe(1);
+      expect(factory).toHaveBeenCalledTimes(1);
+    });
+
+    it('should drop a rejected call so the next caller retries', async () => {
+      const cache = new TtlCache<string, Promise<number>>(1000);
+      const factory = jest.fn().mockRejectedValueOnce(new Error('boom')).mockResolvedValueOnce(2);
+
+      await expect(cache.getOrCreate('a', factory)).rejects.toThrow('boom');
+
+      await expect(cache.getOrCreate('a', factory)).resolves.toBe(2);
+      expect(factory).toHaveBeenCalledTimes(2);
+    });
+
+    it('should keep a newer entry when an expired call rejects late', async () => {
+      jest.useFakeTimers();
+      const cache = new TtlCache<string, Promise<number>>(1000);
+      let rejectStale: (error: Error) => void;
+      const stale = cache.getOrCreate(
+        'a',
+        () => new Promise<number>((resolve, reject) => (rejectStale = reject)),
+      );
+
+      jest.advanceTimersByTime(1001);
+      const fresh = cache.getOrCreate('a', () => Promise.resolve(2));
+      rejectStale(new Error('timeout'));
+      await expect(stale).rejects.toThrow('timeout');
+
+      expect(cache.get('a')).toBe(fresh);
+    });
+  });
+});
@@ -0,0 +1,91 @@
+interface TtlCacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Small in-memory LRU cache with per-entry time-to-live
+ * Relies on Map insertion order: the first key is always the least recently used
+ */
+export class TtlCache<K, V> {
+  private readonly entries = new Map<K, TtlCacheEntry<V>>();
+
+  constructor(
+    private readonly ttlMs: number,
+    private readonly maxEntries: number = 500,
+  ) {}
+
+  /**
+   * Get a cached value, or undefined if missing or expired
+   */
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Move to the most recently used position
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+
+    return entry.value;
+  }
+
+  /**
+   * Store a value, evicting the least recently used entry when full
+   */
+  set(key: K, value: V, ttlMs: number = this.ttlMs): void {
+    this.entries.delete(key);
+
+    if (this.entries.size >= this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value;
+      this.entries.delete(oldestKey);
+    }
+
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+  }
+
+  /**
+   * Get the cached promise for a key, or start one with the factory and cache it,
+   * so concurrent callers share a single pending call
+   * A rejected promise is dropped so the next call retries, unless the entry has
+   * meanwhile expired and been replaced by a newer call
+   */
+  getOrCreate<T>(this: TtlCache<K, Promise<T>>, key: K, factory: () => Promise<T>): Promise<T> {
+    const cached = this.get(key);
+    if (cached) {
+      return cached;
+    }
+
+    const created = factory();
+    this.set(key, created);
+    created.catch(() => {
+      if (this.entries.get(key)?.value === created) {
+        this.entries.delete(key);
+      }
+    });
+
+    return created;
+  }
+
+  has(key: K): boolean {
+    return this.get(key) !== undefined;
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
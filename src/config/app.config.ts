@@ -1,5 +1,6 @@
 import { registerAs } from '@nestjs/config';
 import { IsString, IsInt, IsOptional, IsArray } from 'class-validator';
+import { Transform } from 'class-transformer';
 
 export class AppConfig {
   @IsString()
@@ -10,6 +11,10 @@ export class AppConfig {
   @IsOptional()
   PORT: number = 3001;
 
+  // Comma-separated in the environment; split once when the config is loaded
+  @Transform(({ value }) =>
+    typeof value === 'string' ? value.split(',').map((origin) => origin.trim()) : value,
+  )
   @IsArray()
   @IsOptional()
   ALLOWED_ORIGINS: string[] = ['*'];
@@ -1,9 +1,9 @@
-import { plainToClass } from 'class-transformer';
+import { plainToInstance } from 'class-transformer';
 import { validateSync } from 'class-validator';
 import { AppConfig } from './app.config';
 
 export function validate(config: Record<string, any>) {
-  const validatedConfig = plainToClass(AppConfig, config, {
+  const validatedConfig = plainToInstance(AppConfig, config, {
     enableImplicitConversion: true,
   });
 
@@ -1,50 +1,133 @@
-import { NestFactory } from '@nestjs/core';
-import { ServeStaticModule } from '@nestjs/serve-static';
+import * as clusterModule from 'cluster';
+import { availableParallelism } from 'os';
 import { join } from 'path';
-import { AppModule } from './app.module';
-import { Logger } from '@nestjs/common';
+import type { NestExpressApplication } from '@nestjs/platform-express';
+import { Logger, LogLevel } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import { SwaggerModule, DocumentBuilder } from '@nestjs/swagger';
+import { JsonCompressionMiddleware } from './common/middleware/json-compression.middleware';
+import { LoggerMiddleware } from './common/middleware/logger.middleware';
+import { createValidationPipe } from './common/pipes/validation.pipe';
+import { DeferredConsoleLogger } from './common/utils/deferred-console-logger';
+
+// Resolved once at startup; served for every non-API path
+const PUBLIC_DIR = join(__dirname, '..', 'public');
+const INDEX_FILE = join(PUBLIC_DIR, 'index.html');
+const API_PATH_PREFIX = '/api';
+
+// Upper bound for WEB_CONCURRENCY=auto: every worker loads its own copy of the
+// agents and LangChain, and the host CPU count ignores container CPU quotas
+const MAX_AUTO_WORKERS = 4;
+
+// Crashed workers are replaced after an exponential backoff; after too many
+// crashes in a row the primary gives up. A worker that stayed up for a minute
+// resets the count
+const RESTART_BASE_DELAY_MS = 1000;
+const RESTART_MAX_DELAY_MS = 30 * 1000;
+const MAX_CONSECUTIVE_RESTARTS = 10;
+const STABLE_WORKER_MS = 60 * 1000;
+
+// Outbound calls resolve hostnames on libuv's thread pool, which has only 4 threads
+// by default, so bursts of geocoding, routing and LLM requests queue behind each
+// other. Must be set before the pool is first used; forked workers inherit it
+process.env.UV_THREADPOOL_SIZE = process.env.UV_THREADPOOL_SIZE || '16';
+
+/**
+ * Debug logs dump full LLM prompts and responses, so they are off in production
+ * unless LOG_DEBUG=true
+ */
+function getLogLevels(): LogLevel[] {
+  const levels: LogLevel[] = ['error', 'warn', 'log'];
+  if (process.env.NODE_ENV !== 'production' || process.env.LOG_DEBUG === 'true') {
+    levels.push('debug');
+  }
+
+  return levels;
+}
+
+/**
+ * Per-request access lines are off in production unless LOG_REQUESTS=true; errors
+ * and warnings are still logged
+ */
+function isRequestLoggingEnabled(): boolean {
+  return process.env.NODE_ENV !== 'production' || process.env.LOG_REQUESTS === 'true';
+}
 
 async function bootstrap() {
-  const app = await NestFactory.create(AppModule, {
-    logger: ['error', 'warn', 'log', 'debug'],
+  // Loaded here rather than at the top so a cluster primary, which only forks and
+  // supervises workers, never loads the application graph (agents, LangChain,
+  // Swagger) it would otherwise hold in memory for nothing
+  const { NestFactory } = await import('@nestjs/core');
+  const { SwaggerModule, DocumentBuilder } = await import('@nestjs/swagger');
+  const { AppModule } = await import('./app.module');
+  const express = await import('express');
+
+  // Log calls only queue the record; writes happen in one batch per event-loop turn
+  const logger = new DeferredConsoleLogger();
+  logger.setLogLevels(getLogLevels());
+  process.on('exit', () => logger.flush());
+
+  const app = await NestFactory.create<NestExpressApplication>(AppModule, {
+    logger,
+    // Registered below: the API only accepts JSON bodies
+    bodyParser: false,
   });
   const configService = app.get(ConfigService);
 
+  // Parse request bodies once, as JSON only, and let the global ValidationPipe
+  // turn the parsed object into the DTO; no urlencoded parser in the chain
+  app.useBodyParser('json', { limit: '1mb' });
+
+  // Run shutdown hooks on SIGTERM/SIGINT so pooled connections are closed cleanly
+  app.enableShutdownHooks();
+
+  // API responses are dynamic and rarely revalidated, so skip hashing every JSON
+  // body to build an ETag
+  app.set('etag', false);
+
+  // Don't write an X-Powered-By banner on every response; proxy headers stay
+  // untrusted (Express's default) unless a deployment opts in
+  app.disable('x-powered-by');
+
   // Global API prefix
   app.setGlobalPrefix('api/v1');
 
+  // One shared pipe validates every DTO; class-validator caches each DTO's metadata
+  // after first use, so nothing is rebuilt per request
+  app.useGlobalPipes(createValidationPipe());
+
   // CORS configuration
+  const allowedOrigins = configService.get<string[]>('ALLOWED_ORIGINS');
   app.enableCors({
-    origin: configService.get<string[]>('ALLOWED_ORIGINS') || '*',
+    origin: !allowedOrigins || allowedOrigins.includes('*') ? '*' : allowedOrigins,
     credentials: true,
     methods: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
     allowedHeaders: ['Content-Type', 'Authorization'],
   });
 
-  // Request logging middleware
-  app.use((req, res, next) => {
-    const startTime = Date.now();
-    Logger.log(`Request: ${req.method} ${req.path}`, 'HTTP');
-
-    res.on('finish', () => {
-      const duration = Date.now() - startTime;
-      Logger.log(
-        `Response: ${req.method} ${req.path} - Status: ${res.statusCode} - Duration: ${duration}ms`,
-        'HTTP',
-      );
-    });
+  // Gzip JSON responses of 1 KB or more. Server-Sent Events are left alone:
+  // they are written with res.write, not res.json, so each event goes out at once
+  const jsonCompression = new JsonCompressionMiddleware();
+  app.use((req, res, next) => jsonCompression.use(req, res, next));
 
-    next();
-  });
+  // Request logging - one line per request, written once the response is finished
+  if (isRequestLoggingEnabled()) {
+    const requestLogger = new LoggerMiddleware();
+    app.use((req, res, next) => requestLogger.use(req, res, next));
+  }
 
-  // Static files - serve from public directory
-  const serveStaticModule = ServeStaticModule.forRoot({
-    rootPath: join(process.cwd(), 'public'),
-    exclude: ['/api*'],
+  // Frontend static files. API paths skip the static handler entirely instead of
+  // costing a failed filesystem lookup on every API GET; other GETs that match no
+  // file fall back to the single-page index. Asset URLs are not fingerprinted, so
+  // they keep max-age=0 and are revalidated, getting a 304 via ETag/Last-Modified
+  // when unchanged; a deploy is picked up on the next page load
+  const serveStatic = express.static(PUBLIC_DIR);
+  app.use((req, res, next) => {
+    if (req.path.startsWith(API_PATH_PREFIX)) {
+      return next();
+    }
+
+    serveStatic(req, res, () => (req.method === 'GET' ? res.sendFile(INDEX_FILE) : next()));
   });
-  // Note: ServeStaticModule is already imported in AppModule
 
   // Swagger documentation
   const swaggerConfig = new DocumentBuilder()
@@ -55,8 +138,9 @@ async function bootstrap() {
     .addTag('travel', 'Travel planning and route optimization')
     .addTag('health', 'Health check endpoints')
     .build();
-  const document = SwaggerModule.createDocument(app, swaggerConfig);
-  SwaggerModule.setup('api/docs', app, document);
+  // Build the OpenAPI document on the first docs request instead of at every boot
+  // (and in every cluster worker)
+  SwaggerModule.setup('api/docs', app, () => SwaggerModule.createDocument(app, swaggerConfig));
 
   // Global exception filters
   // app.useGlobalFilters(new GlobalExceptionFilter());
@@ -67,9 +151,123 @@ async function bootstrap() {
   const port = configService.get<number>('PORT') || 3001;
   const host = configService.get<string>('HOST') || '0.0.0.0';
 
+  // Keep idle client connections open longer than typical load balancer idle
+  // timeouts (60s) so they are reused instead of being reset between requests
+  const server = app.getHttpServer();
+  server.keepAliveTimeout = 65000;
+  server.headersTimeout = 66000;
+
   await app.listen(port, host);
   Logger.log(`Application running on: http://${host}:${port}`, 'Bootstrap');
   Logger.log(`Swagger documentation: http://${host}:${port}/api/docs`, 'Bootstrap');
 }
 
-bootstrap();
+/**
+ * Number of worker processes to run; WEB_CONCURRENCY=auto uses one per available
+ * CPU, up to MAX_AUTO_WORKERS, and is also the production default. One event loop
+ * per core is the right fit for Node, unlike the 2*CPU+1 rule for blocking Python
+ * workers
+ * In-memory caches are per process, so each worker warms its own
+ */
+function getWorkerCount(): number {
+  const concurrency =
+    process.env.WEB_CONCURRENCY || (process.env.NODE_ENV === 'production' ? 'auto' : '1');
+  if (concurrency === 'auto') {
+    return Math.min(availableParallelism(), MAX_AUTO_WORKERS);
+  }
+
+  return Math.max(1, parseInt(concurrency, 10) || 1);
+}
+
+// cluster has no default export under CommonJS without esModuleInterop
+const cluster = clusterModule as unknown as clusterModule.Cluster;
+const workerCount = getWorkerCount();
+
+if (workerCount > 1 && cluster.isPrimary) {
+  Logger.log(`Starting ${workerCount} workers`, 'Bootstrap');
+
+  for (let i = 0; i < workerCount; i++) {
+    cluster.fork();
+  }
+
+  // A worker that dies before it ever listened failed at startup (bad config, port
+  // in use); forking a replacement would only fail the same way in a tight loop
+  const listeningSince = new Map<number, number>();
+  let consecutiveRestarts = 0;
+  cluster.on('listening', (worker) => listeningSince.set(worker.id, Date.now()));
+
+  // On SIGTERM/SIGINT pass the signal on to every worker so each runs its Nest
+  // shutdown hooks and finishes in-flight requests, then exit once all are gone.
+  // Without this the primary dies first and workers exit on IPC disconnect,
+  // skipping their shutdown hooks
+  let shuttingDown = false;
+  const countWorkers = () => Object.keys(cluster.workers || {}).length;
+  const shutdown = (signal: NodeJS.Signals) => {
+    if (shuttingDown) {
+      return;
+    }
+    shuttingDown = true;
+    Logger.log(`Received ${signal}, stopping ${countWorkers()} workers`, 'Bootstrap');
+
+    if (countWorkers() === 0) {
+      process.exit(0);
+    }
+    for (const worker of Object.values(cluster.workers || {})) {
+      worker.process.kill('SIGTERM');
+    }
+  };
+  process.on('SIGTERM', shutdown);
+  process.on('SIGINT', shutdown);
+
+  cluster.on('exit', (worker, code, signal) => {
+    const reason = signal || code;
+    const startedAt = listeningSince.get(worker.id);
+    listeningSince.delete(worker.id);
+
+    if (shuttingDown) {
+      if (countWorkers() === 0) {
+        process.exit(0);
+      }
+      return;
+    }
+
+    if (startedAt === undefined) {
+      Logger.error(`Worker ${worker.process.pid} exited during startup (${reason})`, 'Bootstrap');
+      if (countWorkers() === 0) {
+        process.exit(1);
+      }
+      return;
+    }
+
+    if (worker.exitedAfterDisconnect) {
+      return;
+    }
+
+    if (Date.now() - startedAt >= STABLE_WORKER_MS) {
+      consecutiveRestarts = 0;
+    }
+    if (++consecutiveRestarts > MAX_CONSECUTIVE_RESTARTS) {
+      Logger.error(
+        `Workers keep crashing, giving up after ${MAX_CONSECUTIVE_RESTARTS} restarts`,
+        'Bootstrap',
+      );
+      process.exit(1);
+    }
+
+    const delay = Math.min(
+      RESTART_BASE_DELAY_MS * 2 ** (consecutiveRestarts - 1),
+      RESTART_MAX_DELAY_MS,
+    );
+    Logger.warn(
+      `Worker ${worker.process.pid} exited (${reason}), restarting in ${delay}ms`,
+      'Bootstrap',
+    );
+    setTimeout(() => {
+      if (!shuttingDown) {
+        cluster.fork();
+      }
+    }, delay);
+  });
+} else {
+  bootstrap();
+}
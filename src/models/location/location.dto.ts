@@ -1,5 +1,4 @@
-import { IsString, IsNumber, Min, Max, ValidateNested } from 'class-validator';
-import { Type } from 'class-transformer';
+import { IsString } from 'class-validator';
 import { GeoLocationDto } from '../base/geo-location.dto';
 
 export class LocationDto extends GeoLocationDto {
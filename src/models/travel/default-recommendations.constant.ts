@@ -0,0 +1,6 @@
+// Generic travel tips used when no AI recommendations are available
+export const DEFAULT_RECOMMENDATIONS: readonly string[] = Object.freeze([
+  'Take regular breaks every 2 hours',
+  'Check weather conditions before departure',
+  'Keep emergency contacts handy',
+]);
@@ -1,5 +1,6 @@
-export { TransportationType } from './transportation-type.enum';
+export { TransportationType, TRANSPORTATION_TYPES } from './transportation-type.enum';
 export { BudgetRangeDto } from './budget-range.dto';
 export { OvernightStayDto } from './overnight-stay.dto';
 export { TravelRequestDto } from './travel-request.dto';
 export { TravelResponseDto } from './travel-response.dto';
+export { DEFAULT_RECOMMENDATIONS } from './default-recommendations.constant';
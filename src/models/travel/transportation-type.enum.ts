@@ -8,3 +8,8 @@ export enum TransportationType {
   FERRY = 'ferry',
   PLANE = 'plane',
 }
+
+// Allowed values, listed once for validation instead of being re-derived from the enum per check
+export const TRANSPORTATION_TYPES: readonly TransportationType[] = Object.freeze(
+  Object.values(TransportationType),
+);
@@ -1,6 +1,7 @@
 import {
   IsString,
-  IsEnum,
+  IsNotEmpty,
+  IsIn,
   IsOptional,
   IsInt,
   Min,
@@ -9,7 +10,7 @@ import {
   IsBoolean,
 } from 'class-validator';
 import { Type } from 'class-transformer';
-import { TransportationType } from './transportation-type.enum';
+import { TransportationType, TRANSPORTATION_TYPES } from './transportation-type.enum';
 import { CarSpecificationsDto } from '../vehicle/car-specifications.dto';
 import { MotorcycleSpecificationsDto } from '../vehicle/motorcycle-specifications.dto';
 import { BudgetRangeDto } from './budget-range.dto';
@@ -17,12 +18,14 @@ import { OvernightStayDto } from './overnight-stay.dto';
 
 export class TravelRequestDto {
   @IsString()
+  @IsNotEmpty()
   origin: string;
 
   @IsString()
+  @IsNotEmpty()
   destination: string;
 
-  @IsEnum(TransportationType)
+  @IsIn(TRANSPORTATION_TYPES)
   transportationType: TransportationType;
 
   @IsOptional()
@@ -3,6 +3,16 @@ import { Type } from 'class-transformer';
 import { RouteDto } from '../route/route.dto';
 import { TransportCostsDto } from '../costs/transport-costs.dto';
 import { StopDto } from '../stops/stop.dto';
+import { TransportationType } from './transportation-type.enum';
+import type { IRouteWeather } from '../../modules/repositories/weather/open-weather.repository';
+
+// Calories keyed by transport type - a closed key set rather than arbitrary strings
+export type ActivityBreakdown = Partial<Record<TransportationType, number>>;
+
+export interface ITripHealth {
+  totalCalories: number;
+  activityBreakdown: ActivityBreakdown;
+}
 
 export class TravelResponseDto {
   @ValidateNested()
@@ -21,17 +31,11 @@ export class TravelResponseDto {
 
   @IsObject()
   @IsOptional()
-  health?: {
-    totalCalories: number;
-    activityBreakdown: Record<string, number>;
-  };
+  health?: ITripHealth;
 
   @IsObject()
   @IsOptional()
-  weather?: {
-    origin: any;
-    destination: any;
-  };
+  weather?: IRouteWeather;
 
   @IsArray()
   @IsString({ each: true })
@@ -0,0 +1,18 @@
+// Average fuel prices by fuel type (USD per liter)
+export const FUEL_PRICES: Readonly<Record<string, number>> = Object.freeze({
+  gasoline: 1.5,
+  diesel: 1.4,
+  electric: 0.3, // per kWh equivalent
+  '92': 1.45,
+  '95': 1.5,
+  '98': 1.6,
+});
+
+export const DEFAULT_FUEL_PRICE = 1.5;
+
+/**
+ * Price per liter for a fuel type, falling back to the gasoline average
+ */
+export function getFuelPrice(fuelType: string): number {
+  return FUEL_PRICES[fuelType] || DEFAULT_FUEL_PRICE;
+}
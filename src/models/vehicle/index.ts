@@ -1,3 +1,4 @@
 export { CarSpecificationsDto } from './car-specifications.dto';
 export { MotorcycleSpecificationsDto } from './motorcycle-specifications.dto';
 export { VehicleType } from './vehicle-type.enum';
+export { FUEL_PRICES, DEFAULT_FUEL_PRICE, getFuelPrice } from './fuel-prices.constant';
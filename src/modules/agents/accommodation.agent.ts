@@ -18,17 +18,7 @@ export interface AccommodationRecommendation {
   bookingTips: string[];
 }
 
-/**
- * Accommodation Agent - Provides accommodation recommendations
- */
-@Injectable()
-export class AccommodationAgent extends BaseAgent {
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const ACCOMMODATION_PROMPT_TEMPLATE = `
 You are an expert accommodation recommendation assistant for travel planning.
 
 Provide accommodation recommendations based on:
@@ -47,6 +37,21 @@ Provide your recommendations in JSON format with these fields:
 
 Accommodation Analysis:
 `;
+
+/**
+ * Accommodation Agent - Provides accommodation recommendations
+ */
+@Injectable()
+export class AccommodationAgent extends BaseAgent {
+  // Availability and prices change quickly
+  protected readonly cacheTtlMs = 5 * 60 * 1000;
+
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return ACCOMMODATION_PROMPT_TEMPLATE;
   }
 
   /**
@@ -64,21 +69,11 @@ Accommodation Analysis:
         preferences: input.preferences?.join(', ') || 'none',
       });
 
-      return {
-        success: true,
-        data: result,
-        metadata: {
-          agentName: 'Accommodation',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok(result);
     } catch (error) {
       this.logger.error(`Accommodation recommendation error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 }
@@ -1,30 +1,44 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import { RouteAgent } from './route.agent';
-import { AccommodationAgent } from './accommodation.agent';
-import { FuelAgent } from './fuel.agent';
-import { CostAgent } from './cost.agent';
-import { HealthAgent } from './health.agent';
-import { StopsAgent } from './stops.agent';
-import { FoodAgent } from './food.agent';
-import { WeatherAgent } from './weather.agent';
+import { RouteAgent, RouteAnalysisResult } from './route.agent';
+import { AccommodationAgent, AccommodationRecommendation } from './accommodation.agent';
+import { FuelAgent, FuelAnalysisResult } from './fuel.agent';
+import { CostAgent, CostBreakdown } from './cost.agent';
+import { HealthAgent, HealthAnalysisResult } from './health.agent';
+import { StopsAgent, StopsAnalysisResult } from './stops.agent';
+import { FoodAgent, FoodAnalysisResult } from './food.agent';
+import { WeatherAgent, WeatherAnalysisResult } from './weather.agent';
+import { AgentInput, AgentResponse, BaseAgent } from './base.agent';
 import { TravelRequestDto } from '../../models/travel/travel-request.dto';
+import { TransportationType } from '../../models/travel/transportation-type.enum';
+import { DEFAULT_RECOMMENDATIONS } from '../../models/travel/default-recommendations.constant';
 import { RouteDto } from '../../models/route/route.dto';
 import { TransportCostsDto } from '../../models/costs/transport-costs.dto';
 import { IWeatherData } from '../repositories/weather/open-weather.repository';
 
+// Transport types that get a health analysis or a fuel analysis. Keyed by the enum
+// values themselves: the request is validated against them, so no normalization
+const ACTIVE_TRANSPORT_TYPES: ReadonlySet<TransportationType> = new Set([
+  TransportationType.WALKING,
+  TransportationType.BICYCLE,
+]);
+const MOTORIZED_TRANSPORT_TYPES: ReadonlySet<TransportationType> = new Set([
+  TransportationType.CAR,
+  TransportationType.MOTORCYCLE,
+]);
+
 /**
  * Coordinator response interface
  */
 export interface CoordinatorResponse {
-  routeAnalysis?: any;
-  accommodationRecommendations?: any;
-  fuelAnalysis?: any;
-  costAnalysis?: any;
-  healthAnalysis?: any;
-  stopsRecommendations?: any;
-  foodRecommendations?: any;
-  weatherAnalysis?: any;
+  routeAnalysis?: RouteAnalysisResult;
+  accommodationRecommendations?: AccommodationRecommendation;
+  fuelAnalysis?: FuelAnalysisResult;
+  costAnalysis?: CostBreakdown;
+  healthAnalysis?: HealthAnalysisResult;
+  stopsRecommendations?: StopsAnalysisResult;
+  foodRecommendations?: FoodAnalysisResult;
+  weatherAnalysis?: WeatherAnalysisResult;
   summary: {
     totalEstimatedCost: number;
     totalTravelTime: number;
@@ -39,6 +53,8 @@ export interface CoordinatorResponse {
 @Injectable()
 export class AgentsCoordinator {
   private readonly logger = new Logger(AgentsCoordinator.name);
+  // Agents by lowercase name, resolved once for runAgent lookups
+  private readonly agentsByName: ReadonlyMap<string, BaseAgent>;
 
   constructor(
     private readonly configService: ConfigService,
@@ -50,7 +66,18 @@ export class AgentsCoordinator {
     private readonly stopsAgent: StopsAgent,
     private readonly foodAgent: FoodAgent,
     private readonly weatherAgent: WeatherAgent,
-  ) {}
+  ) {
+    this.agentsByName = new Map<string, BaseAgent>([
+      ['route', routeAgent],
+      ['accommodation', accommodationAgent],
+      ['fuel', fuelAgent],
+      ['cost', costAgent],
+      ['health', healthAgent],
+      ['stops', stopsAgent],
+      ['food', foodAgent],
+      ['weather', weatherAgent],
+    ]);
+  }
 
   /**
    * Coordinate all agents for comprehensive travel planning
@@ -72,6 +99,12 @@ export class AgentsCoordinator {
       },
     };
 
+    // Agent inputs shared by several agents, converted once
+    const distanceKm = route.totalDistance / 1000;
+    const durationHours = route.totalDuration / 60;
+    const passengers = request.passengers || 1;
+    const routeLabel = `${request.origin} to ${request.destination}`;
+
     // Run agents in parallel where possible
     const promises: Promise<void>[] = [];
 
@@ -96,9 +129,9 @@ export class AgentsCoordinator {
       this.costAgent
         .analyzeCosts({
           transportationType: request.transportationType,
-          distance: route.totalDistance / 1000,
-          duration: route.totalDuration / 60,
-          passengers: request.passengers || 1,
+          distance: distanceKm,
+          duration: durationHours,
+          passengers,
           fuelCost: costs.fuelCost,
           ticketCost: costs.ticketCost,
         })
@@ -117,8 +150,8 @@ export class AgentsCoordinator {
     promises.push(
       this.stopsAgent
         .recommendStops({
-          route: `${request.origin} to ${request.destination}`,
-          duration: route.totalDuration / 60,
+          route: routeLabel,
+          duration: durationHours,
           transportationType: request.transportationType,
         })
         .then((result) => {
@@ -134,9 +167,9 @@ export class AgentsCoordinator {
     promises.push(
       this.foodAgent
         .recommendFood({
-          route: `${request.origin} to ${request.destination}`,
-          duration: route.totalDuration / 60,
-          passengers: request.passengers || 1,
+          route: routeLabel,
+          duration: durationHours,
+          passengers,
         })
         .then((result) => {
           if (result.success) {
@@ -147,14 +180,14 @@ export class AgentsCoordinator {
     );
 
     // Health analysis (for active transport)
-    if (['walking', 'bicycle', 'bicycling'].includes(request.transportationType.toLowerCase())) {
+    if (ACTIVE_TRANSPORT_TYPES.has(request.transportationType)) {
       promises.push(
         this.healthAgent
           .analyzeHealth({
             transportationType: request.transportationType,
-            distance: route.totalDistance / 1000,
-            duration: route.totalDuration / 60,
-            passengers: request.passengers || 1,
+            distance: distanceKm,
+            duration: durationHours,
+            passengers,
           })
           .then((result) => {
             if (result.success) {
@@ -166,18 +199,18 @@ export class AgentsCoordinator {
     }
 
     // Fuel analysis (for motorized transport)
-    if (['car', 'motorcycle'].includes(request.transportationType.toLowerCase())) {
+    if (MOTORIZED_TRANSPORT_TYPES.has(request.transportationType)) {
       const specs = request.carSpecifications || request.motorcycleSpecifications;
       if (specs) {
         promises.push(
           this.fuelAgent
             .calculateFuel({
-              distance: route.totalDistance / 1000,
+              distance: distanceKm,
               fuelType: specs.fuelType,
               fuelConsumption: specs.fuelConsumption,
               tankCapacity: specs.tankCapacity,
               initialFuel: specs.initialFuel,
-              route: `${request.origin} to ${request.destination}`,
+              route: routeLabel,
             })
             .then((result) => {
               if (result.success) {
@@ -211,11 +244,7 @@ export class AgentsCoordinator {
 
     // Ensure we have at least some key recommendations
     if (results.summary.keyRecommendations.length === 0) {
-      results.summary.keyRecommendations = [
-        'Take regular breaks every 2 hours',
-        'Check weather conditions before departure',
-        'Keep emergency contacts handy',
-      ];
+      results.summary.keyRecommendations = DEFAULT_RECOMMENDATIONS.slice();
     }
 
     return results;
@@ -224,13 +253,17 @@ export class AgentsCoordinator {
   /**
    * Run a specific agent
    */
-  async runAgent(agentName: string, input: any): Promise<any> {
-    const agent = this[`${agentName.toLowerCase()}Agent`];
-    
+  async runAgent(agentName: string, input: AgentInput): Promise<AgentResponse<string>> {
+    return this.getAgent(agentName).execute(input);
+  }
+
+  private getAgent(agentName: string): BaseAgent {
+    const agent = this.agentsByName.get(agentName.toLowerCase());
+
     if (!agent) {
       throw new Error(`Unknown agent: ${agentName}`);
     }
 
-    return await agent.execute(input);
+    return agent;
   }
 }
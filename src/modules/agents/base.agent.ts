@@ -1,15 +1,26 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { ChatOpenAI } from '@langchain/openai';
+import { getSharedChatOpenAI } from '../../common/utils/llm';
+import { TtlCache } from '../../common/utils/ttl-cache';
+import { CircuitBreaker } from '../../common/utils/circuit-breaker';
+import { extractJson } from '../../common/utils/helpers';
+
+const MISSING_API_KEY_ERROR = 'DeepSeek API key not configured';
+
+/**
+ * Prompt variables sent to an agent, serialized as JSON after the template
+ */
+export type AgentInput = Record<string, unknown>;
 
 /**
  * Base response interface for all agents
  */
 export interface AgentResponse<T = any> {
-  success: boolean;
-  data?: T;
-  error?: string;
-  metadata?: Record<string, any>;
+  readonly success: boolean;
+  readonly data?: T;
+  readonly error?: string;
+  readonly metadata?: Record<string, any>;
 }
 
 /**
@@ -18,29 +29,49 @@ export interface AgentResponse<T = any> {
  */
 @Injectable()
 export abstract class BaseAgent {
+  // LLM responses shared by all agents, keyed by agent name and full prompt
+  private static readonly responseCache = new TtlCache<string, string>(15 * 60 * 1000, 1000);
+
+  // LLM calls currently running, keyed like the response cache
+  private static readonly inFlight = new Map<string, Promise<string>>();
+
+  // Trimmed prompt templates, built once per agent class
+  private static readonly systemPrompts = new Map<Function, string>();
+
   protected readonly logger = new Logger(BaseAgent.name);
-  protected llm: ChatOpenAI;
+  // Stops hammering the LLM provider while it is failing for this agent
+  private readonly breaker = new CircuitBreaker(this.constructor.name);
+  private client?: ChatOpenAI;
+  private readonly apiKey?: string;
+
+  /**
+   * How long identical prompts are served from the response cache (0 disables caching)
+   * Override in subclasses whose answers go stale faster or slower
+   */
+  protected readonly cacheTtlMs: number = 15 * 60 * 1000;
 
   constructor(
     protected readonly configService: ConfigService,
-    modelName: string = 'deepseek-chat',
-    temperature: number = 0.7,
+    private readonly modelName: string = 'deepseek-chat',
+    private readonly temperature: number = 0.7,
   ) {
-    const apiKey = this.configService.get<string>('DEEPSEEK_API_KEY');
+    this.apiKey = this.configService.get<string>('DEEPSEEK_API_KEY');
 
-    if (!apiKey) {
-      this.logger.warn('DeepSeek API key not configured');
-      return;
+    if (!this.apiKey) {
+      this.logger.warn(MISSING_API_KEY_ERROR);
     }
+  }
 
-    this.llm = new ChatOpenAI({
-      openAIApiKey: apiKey,
-      modelName,
-      temperature,
-      configuration: {
-        baseURL: 'https://api.deepseek.com',
-      },
-    });
+  /**
+   * LLM client, created on first use so agents that never run during a
+   * request (e.g. fuel analysis for a bicycle trip) never build one
+   */
+  protected get llm(): ChatOpenAI {
+    if (!this.client && this.apiKey) {
+      this.client = getSharedChatOpenAI(this.apiKey, this.modelName, this.temperature);
+    }
+
+    return this.client;
   }
 
   /**
@@ -49,61 +80,142 @@ export abstract class BaseAgent {
    */
   protected abstract getPromptTemplate(): string;
 
+  /**
+   * The prompt template is static per class, so trimming it once keeps the system
+   * message byte-identical across calls and lets the provider's prefix cache reuse it
+   */
+  private getSystemPrompt(): string {
+    let systemPrompt = BaseAgent.systemPrompts.get(this.constructor);
+
+    if (systemPrompt === undefined) {
+      systemPrompt = this.getPromptTemplate().trim();
+      BaseAgent.systemPrompts.set(this.constructor, systemPrompt);
+    }
+
+    return systemPrompt;
+  }
+
   /**
    * Execute the agent with given input
    */
-  async execute(input: any): Promise<AgentResponse> {
+  async execute(input: AgentInput): Promise<AgentResponse<string>> {
     try {
-      const prompt = this.getPromptTemplate();
-      const fullPrompt = `${prompt}\n\nInput: ${JSON.stringify(input)}`;
+      return this.ok(await this.complete(input));
+    } catch (error) {
+      this.logger.error(`Agent execution error: ${error.message}`);
+
+      return this.fail(error.message);
+    }
+  }
+
+  /**
+   * Get the raw LLM answer for an input, from the cache, a matching in-flight
+   * call or a new LLM call; throws on failure
+   */
+  private async complete(input: AgentInput): Promise<string> {
+    // Fail before building the prompt, and without counting against the circuit breaker
+    if (!this.apiKey) {
+      throw new Error(MISSING_API_KEY_ERROR);
+    }
+
+    const systemPrompt = this.getSystemPrompt();
+    const userPrompt = `Input: ${JSON.stringify(input)}`;
+    const fullPrompt = `${systemPrompt}\n\n${userPrompt}`;
+
+    const cacheKey = `${this.constructor.name}:${fullPrompt}`;
+    const cached = this.cacheTtlMs > 0 ? BaseAgent.responseCache.get(cacheKey) : undefined;
+
+    if (cached !== undefined) {
+      this.logger.debug(`Agent cache hit: ${this.constructor.name}`);
+      return cached;
+    }
+
+    // Concurrent identical prompts share one in-flight LLM call
+    let pending = BaseAgent.inFlight.get(cacheKey);
 
+    if (!pending) {
       this.logger.debug(`Agent Request: ${fullPrompt}`);
 
-      const response = await this.llm.invoke([
-        ['human', fullPrompt]
-      ]);
+      pending = this.invokeLLM(systemPrompt, userPrompt, cacheKey);
+      BaseAgent.inFlight.set(cacheKey, pending);
+    }
+
+    return pending;
+  }
+
+  /**
+   * Call the LLM and cache the answer, clearing the in-flight entry either way
+   */
+  private async invokeLLM(
+    systemPrompt: string,
+    userPrompt: string,
+    cacheKey: string,
+  ): Promise<string> {
+    try {
+      const response = await this.breaker.execute(() =>
+        this.llm.invoke([
+          ['system', systemPrompt],
+          ['human', userPrompt],
+        ]),
+      );
 
       this.logger.debug(`Agent Response: ${response.content}`);
 
-      return {
-        success: true,
-        data: response.content,
-        metadata: {
-          agentName: this.constructor.name,
-          timestamp: new Date().toISOString(),
-        },
-      };
-    } catch (error) {
-      this.logger.error(`Agent execution error: ${error.message}`);
+      const content = response.content as string;
+      if (this.cacheTtlMs > 0) {
+        BaseAgent.responseCache.set(cacheKey, content, this.cacheTtlMs);
+      }
 
-      return {
-        success: false,
-        error: error.message,
-        metadata: {
-          agentName: this.constructor.name,
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return content;
+    } finally {
+      BaseAgent.inFlight.delete(cacheKey);
     }
   }
 
   /**
-   * Execute and parse JSON response
+   * Build a successful response
+   * Every response is created with the same fields in the same order
    */
-  protected async executeAndParseJSON(input: any): Promise<any> {
-    const response = await this.execute(input);
+  protected ok<T>(data: T): AgentResponse<T> {
+    return {
+      success: true,
+      data,
+      error: undefined,
+      metadata: {
+        agentName: this.getAgentName(),
+        timestamp: new Date().toISOString(),
+      },
+    };
+  }
 
-    if (!response.success || !response.data) {
-      throw new Error(response.error || 'Agent execution failed');
-    }
+  /**
+   * Build a failed response, optionally carrying fallback data
+   */
+  protected fail<T = any>(error: string, data?: T): AgentResponse<T> {
+    return {
+      success: false,
+      data,
+      error,
+      metadata: {
+        agentName: this.getAgentName(),
+        timestamp: new Date().toISOString(),
+      },
+    };
+  }
 
-    const content = response.data as string;
+  /**
+   * Execute and parse JSON response
+   */
+  protected async executeAndParseJSON<T = any>(input: AgentInput): Promise<T> {
+    // Skip building an AgentResponse that would be unwrapped straight away;
+    // failures are logged by the caller that handles them
+    const content = await this.complete(input);
 
-    // Extract JSON from markdown code blocks if present
-    const jsonMatch = content.match(/```(?:json)?\s*([\s\S]*?)```/);
-    const jsonContent = jsonMatch ? jsonMatch[1].trim() : content;
+    if (!content) {
+      throw new Error('Agent execution failed');
+    }
 
-    return JSON.parse(jsonContent);
+    return extractJson<T>(content);
   }
 
   /**
@@ -20,17 +20,7 @@ export interface CostBreakdown {
   costSavingTips: string[];
 }
 
-/**
- * Cost Agent - Analyzes and optimizes travel costs
- */
-@Injectable()
-export class CostAgent extends BaseAgent {
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const COST_PROMPT_TEMPLATE = `
 You are an expert travel cost analysis and optimization assistant.
 
 Analyze travel costs for a trip:
@@ -49,6 +39,18 @@ Provide your analysis in JSON format with these fields:
 
 Cost Analysis:
 `;
+
+/**
+ * Cost Agent - Analyzes and optimizes travel costs
+ */
+@Injectable()
+export class CostAgent extends BaseAgent {
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return COST_PROMPT_TEMPLATE;
   }
 
   /**
@@ -65,21 +67,11 @@ Cost Analysis:
         ticketCost: input.ticketCost || 0,
       });
 
-      return {
-        success: true,
-        data: result,
-        metadata: {
-          agentName: 'Cost',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok(result);
     } catch (error) {
       this.logger.error(`Cost analysis error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 
@@ -105,21 +97,11 @@ Format: { car: {...}, motorcycle: {...}, bus: {...}, train: {...}, recommendatio
 
       const result = await this.executeAndParseJSON({ prompt });
 
-      return {
-        success: true,
-        data: result,
-        metadata: {
-          agentName: 'Cost',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok(result);
     } catch (error) {
       this.logger.error(`Transportation comparison error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 }
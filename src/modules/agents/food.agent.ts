@@ -27,27 +27,28 @@ export interface FoodAnalysisResult {
   foodTips: string[];
 }
 
+// Average food cost per person per meal (USD)
+const FOOD_COSTS = Object.freeze({
+  budget: 10,
+  moderate: 25,
+  premium: 50,
+});
+
+// Water requirement per person per hour (liters)
+const WATER_PER_HOUR = 0.5;
+
 /**
- * Food Agent - Recommends food stops and calculates food requirements
+ * Food and water needs for a trip, computed together in one place
  */
-@Injectable()
-export class FoodAgent extends BaseAgent {
-  // Average food cost per person per meal (USD)
-  private readonly FOOD_COSTS = {
-    budget: 10,
-    moderate: 25,
-    premium: 50,
+function estimateProvisions(durationHours: number, passengers: number, costPerMeal: number) {
+  const numMeals = Math.ceil(durationHours / 4); // Assume meal every 4 hours
+  return {
+    foodCost: numMeals * costPerMeal * passengers,
+    waterLiters: durationHours * WATER_PER_HOUR * passengers,
   };
+}
 
-  // Water requirement per person per hour (liters)
-  private readonly WATER_PER_HOUR = 0.5;
-
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const FOOD_PROMPT_TEMPLATE = `
 You are an expert food and dining recommendation assistant for travel planning.
 
 Recommend food options for a trip:
@@ -72,6 +73,18 @@ Provide your recommendations in JSON format with these fields:
 
 Food Analysis:
 `;
+
+/**
+ * Food Agent - Recommends food stops and calculates food requirements
+ */
+@Injectable()
+export class FoodAgent extends BaseAgent {
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return FOOD_PROMPT_TEMPLATE;
   }
 
   /**
@@ -79,10 +92,10 @@ Food Analysis:
    */
   async recommendFood(input: FoodInput): Promise<AgentResponse<FoodAnalysisResult>> {
     try {
-      const numMeals = Math.ceil(input.duration / 4); // Assume meal every 4 hours
-      const budgetPerPerson = input.budget?.max || this.FOOD_COSTS.moderate;
-      const totalFoodBudget = numMeals * budgetPerPerson * input.passengers;
-      const waterRequirements = Math.round(input.duration * this.WATER_PER_HOUR * input.passengers);
+      const budgetPerPerson = input.budget?.max || FOOD_COSTS.moderate;
+      const provisions = estimateProvisions(input.duration, input.passengers, budgetPerPerson);
+      const totalFoodBudget = provisions.foodCost;
+      const waterRequirements = Math.round(provisions.waterLiters);
 
       const result = await this.executeAndParseJSON({
         route: input.route,
@@ -96,26 +109,16 @@ Food Analysis:
         calculatedWater: waterRequirements,
       });
 
-      return {
-        success: true,
-        data: {
-          recommendedStops: result.recommendedStops || [],
-          totalFoodBudget: result.totalFoodBudget || totalFoodBudget,
-          waterRequirements: result.waterRequirements || waterRequirements,
-          foodTips: result.foodTips || [],
-        },
-        metadata: {
-          agentName: 'Food',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok({
+        recommendedStops: result.recommendedStops || [],
+        totalFoodBudget: result.totalFoodBudget || totalFoodBudget,
+        waterRequirements: result.waterRequirements || waterRequirements,
+        foodTips: result.foodTips || [],
+      });
     } catch (error) {
       this.logger.error(`Food recommendation error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 
@@ -127,9 +130,11 @@ Food Analysis:
     waterCost: number;
     waterLiters: number;
   } {
-    const numMeals = Math.ceil(durationHours / 4);
-    const foodCost = numMeals * this.FOOD_COSTS.moderate * passengers;
-    const waterLiters = durationHours * this.WATER_PER_HOUR * passengers;
+    const { foodCost, waterLiters } = estimateProvisions(
+      durationHours,
+      passengers,
+      FOOD_COSTS.moderate,
+    );
     const waterCost = waterLiters * 2; // ~$2 per liter bottled water
 
     return {
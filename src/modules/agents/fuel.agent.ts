@@ -1,6 +1,7 @@
 import { Injectable } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { BaseAgent, AgentResponse } from './base.agent';
+import { getFuelPrice } from '../../models/vehicle/fuel-prices.constant';
 
 export interface FuelInput {
   distance: number; // km
@@ -19,27 +20,7 @@ export interface FuelAnalysisResult {
   fuelEfficiencyTips: string[];
 }
 
-/**
- * Fuel Agent - Calculates fuel requirements and costs
- */
-@Injectable()
-export class FuelAgent extends BaseAgent {
-  // Average fuel prices by type (USD per liter)
-  private readonly FUEL_PRICES = {
-    gasoline: 1.5,
-    diesel: 1.4,
-    electric: 0.3,
-    '92': 1.45,
-    '95': 1.5,
-    '98': 1.6,
-  };
-
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const FUEL_PROMPT_TEMPLATE = `
 You are an expert fuel efficiency and cost analysis assistant for travel planning.
 
 Analyze fuel requirements for a trip:
@@ -59,6 +40,21 @@ Provide your analysis in JSON format with these fields:
 
 Fuel Analysis:
 `;
+
+/**
+ * Fuel Agent - Calculates fuel requirements and costs
+ */
+@Injectable()
+export class FuelAgent extends BaseAgent {
+  // Fuel maths only depends on the static vehicle specs and distance
+  protected readonly cacheTtlMs = 24 * 60 * 60 * 1000;
+
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return FUEL_PROMPT_TEMPLATE;
   }
 
   /**
@@ -66,7 +62,7 @@ Fuel Analysis:
    */
   async calculateFuel(input: FuelInput): Promise<AgentResponse<FuelAnalysisResult>> {
     try {
-      const fuelPrice = this.FUEL_PRICES[input.fuelType as keyof typeof this.FUEL_PRICES] || 1.5;
+      const fuelPrice = getFuelPrice(input.fuelType);
       const totalFuelNeeded = (input.fuelConsumption * input.distance) / 100;
       const estimatedCost = totalFuelNeeded * fuelPrice;
 
@@ -92,27 +88,17 @@ Fuel Analysis:
         calculatedStops: refuelingStops,
       });
 
-      return {
-        success: true,
-        data: {
-          totalFuelNeeded: result.totalFuelNeeded || totalFuelNeeded,
-          estimatedCost: result.estimatedCost || estimatedCost,
-          refuelingStops: result.refuelingStops || refuelingStops,
-          refuelingLocations: result.refuelingLocations || [],
-          fuelEfficiencyTips: result.fuelEfficiencyTips || [],
-        },
-        metadata: {
-          agentName: 'Fuel',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok({
+        totalFuelNeeded: result.totalFuelNeeded || totalFuelNeeded,
+        estimatedCost: result.estimatedCost || estimatedCost,
+        refuelingStops: result.refuelingStops || refuelingStops,
+        refuelingLocations: result.refuelingLocations || [],
+        fuelEfficiencyTips: result.fuelEfficiencyTips || [],
+      });
     } catch (error) {
       this.logger.error(`Fuel calculation error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 }
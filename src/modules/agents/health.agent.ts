@@ -1,13 +1,14 @@
 import { Injectable } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { BaseAgent, AgentResponse } from './base.agent';
+import { IWeatherData } from '../repositories/weather/open-weather.repository';
 
 export interface HealthInput {
   transportationType: string;
   distance: number; // km
   duration: number; // hours
   passengers: number;
-  weather?: any;
+  weather?: IWeatherData;
 }
 
 export interface HealthAnalysisResult {
@@ -18,25 +19,15 @@ export interface HealthAnalysisResult {
   hydrationRecommendations: string[];
 }
 
-/**
- * Health Agent - Analyzes health impact and provides recommendations
- */
-@Injectable()
-export class HealthAgent extends BaseAgent {
-  // Calories burned per km by activity type
-  private readonly CALORIES_PER_KM = {
-    walking: 50,
-    bicycling: 30,
-    running: 70,
-    hiking: 60,
-  };
+// Calories burned per km by activity type
+const CALORIES_PER_KM = Object.freeze({
+  walking: 50,
+  bicycling: 30,
+  running: 70,
+  hiking: 60,
+});
 
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const HEALTH_PROMPT_TEMPLATE = `
 You are an expert health and fitness assistant for travel planning.
 
 Analyze health impact for a trip:
@@ -55,6 +46,18 @@ Provide your analysis in JSON format with these fields:
 
 Health Analysis:
 `;
+
+/**
+ * Health Agent - Analyzes health impact and provides recommendations
+ */
+@Injectable()
+export class HealthAgent extends BaseAgent {
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return HEALTH_PROMPT_TEMPLATE;
   }
 
   /**
@@ -67,9 +70,9 @@ Health Analysis:
 
       // Calculate calories for active transportation
       if (transType === 'walking') {
-        totalCalories = Math.round(this.CALORIES_PER_KM.walking * input.distance * input.passengers);
+        totalCalories = Math.round(CALORIES_PER_KM.walking * input.distance * input.passengers);
       } else if (transType === 'bicycling' || transType === 'bicycle') {
-        totalCalories = Math.round(this.CALORIES_PER_KM.bicycling * input.distance * input.passengers);
+        totalCalories = Math.round(CALORIES_PER_KM.bicycling * input.distance * input.passengers);
       }
 
       const result = await this.executeAndParseJSON({
@@ -81,27 +84,17 @@ Health Analysis:
         calculatedCalories: totalCalories,
       });
 
-      return {
-        success: true,
-        data: {
-          totalCalories: result.totalCalories || totalCalories,
-          activityBreakdown: result.activityBreakdown || { [input.transportationType]: totalCalories },
-          healthBenefits: result.healthBenefits || [],
-          healthWarnings: result.healthWarnings || [],
-          hydrationRecommendations: result.hydrationRecommendations || [],
-        },
-        metadata: {
-          agentName: 'Health',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok({
+        totalCalories: result.totalCalories || totalCalories,
+        activityBreakdown: result.activityBreakdown || { [input.transportationType]: totalCalories },
+        healthBenefits: result.healthBenefits || [],
+        healthWarnings: result.healthWarnings || [],
+        hydrationRecommendations: result.hydrationRecommendations || [],
+      });
     } catch (error) {
       this.logger.error(`Health analysis error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 }
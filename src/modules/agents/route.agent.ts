@@ -17,17 +17,7 @@ export interface RouteAnalysisResult {
   warnings: string[];
 }
 
-/**
- * Route Agent - Analyzes routes and provides recommendations
- */
-@Injectable()
-export class RouteAgent extends BaseAgent {
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const ROUTE_PROMPT_TEMPLATE = `
 You are an expert route analysis assistant for travel planning.
 
 Analyze the following route information and provide recommendations:
@@ -45,6 +35,18 @@ Provide your analysis in JSON format with these fields:
 
 Route Analysis:
 `;
+
+/**
+ * Route Agent - Analyzes routes and provides recommendations
+ */
+@Injectable()
+export class RouteAgent extends BaseAgent {
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return ROUTE_PROMPT_TEMPLATE;
   }
 
   /**
@@ -61,21 +63,11 @@ Route Analysis:
         numSegments: route.segments.length,
       });
 
-      return {
-        success: true,
-        data: result,
-        metadata: {
-          agentName: 'Route',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok(result);
     } catch (error) {
       this.logger.error(`Route analysis error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 }
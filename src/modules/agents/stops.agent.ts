@@ -23,17 +23,7 @@ export interface StopsAnalysisResult {
   totalStopTime: number; // minutes
 }
 
-/**
- * Stops Agent - Recommends optimal stops during travel
- */
-@Injectable()
-export class StopsAgent extends BaseAgent {
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const STOPS_PROMPT_TEMPLATE = `
 You are an expert travel stops and rest planning assistant.
 
 Recommend optimal stops for a trip:
@@ -60,6 +50,18 @@ Consider:
 
 Stops Analysis:
 `;
+
+/**
+ * Stops Agent - Recommends optimal stops during travel
+ */
+@Injectable()
+export class StopsAgent extends BaseAgent {
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return STOPS_PROMPT_TEMPLATE;
   }
 
   /**
@@ -74,21 +76,11 @@ Stops Analysis:
         preferences: input.preferences?.join(', ') || 'none',
       });
 
-      return {
-        success: true,
-        data: result,
-        metadata: {
-          agentName: 'Stops',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok(result);
     } catch (error) {
       this.logger.error(`Stops recommendation error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 
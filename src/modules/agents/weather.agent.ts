@@ -20,17 +20,7 @@ export interface WeatherAnalysisResult {
   packingList: string[];
 }
 
-/**
- * Weather Agent - Analyzes weather conditions and provides recommendations
- */
-@Injectable()
-export class WeatherAgent extends BaseAgent {
-  constructor(protected readonly configService: ConfigService) {
-    super(configService, 'gpt-3.5-turbo', 0.7);
-  }
-
-  protected getPromptTemplate(): string {
-    return `
+const WEATHER_PROMPT_TEMPLATE = `
 You are an expert weather analysis and travel recommendation assistant.
 
 Analyze weather conditions for a trip:
@@ -57,6 +47,18 @@ Consider:
 
 Weather Analysis:
 `;
+
+/**
+ * Weather Agent - Analyzes weather conditions and provides recommendations
+ */
+@Injectable()
+export class WeatherAgent extends BaseAgent {
+  constructor(protected readonly configService: ConfigService) {
+    super(configService, 'gpt-3.5-turbo', 0.7);
+  }
+
+  protected getPromptTemplate(): string {
+    return WEATHER_PROMPT_TEMPLATE;
   }
 
   /**
@@ -68,47 +70,38 @@ Weather Analysis:
     activities?: string[],
   ): Promise<AgentResponse<WeatherAnalysisResult>> {
     try {
+      // Weather objects are serialized once with the rest of the input rather than
+      // pre-stringified; the travel date only needs day precision
       const result = await this.executeAndParseJSON({
         origin: originWeather.location,
         destination: destinationWeather.location,
-        date: new Date().toISOString(),
+        date: new Date().toISOString().slice(0, 10),
         activities: activities?.join(', ') || 'general travel',
-        originWeather: JSON.stringify(originWeather),
-        destinationWeather: JSON.stringify(destinationWeather),
+        originWeather,
+        destinationWeather,
       });
 
-      return {
-        success: true,
-        data: {
-          summary: result.summary || 'Weather conditions are typical for this route',
-          originWeather,
-          destinationWeather,
-          travelConditions: result.travelConditions || 'good',
-          recommendations: result.recommendations || [],
-          warnings: result.warnings || [],
-          packingList: result.packingList || [],
-        },
-        metadata: {
-          agentName: 'Weather',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok({
+        summary: result.summary || 'Weather conditions are typical for this route',
+        originWeather,
+        destinationWeather,
+        travelConditions: result.travelConditions || 'good',
+        recommendations: result.recommendations || [],
+        warnings: result.warnings || [],
+        packingList: result.packingList || [],
+      });
     } catch (error) {
       this.logger.error(`Weather analysis error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-        data: {
-          summary: 'Unable to analyze weather conditions',
-          originWeather,
-          destinationWeather,
-          travelConditions: 'unknown',
-          recommendations: ['Check weather forecast before departure'],
-          warnings: ['Weather analysis unavailable'],
-          packingList: [],
-        },
-      };
+      return this.fail(error.message, {
+        summary: 'Unable to analyze weather conditions',
+        originWeather,
+        destinationWeather,
+        travelConditions: 'unknown',
+        recommendations: ['Check weather forecast before departure'],
+        warnings: ['Weather analysis unavailable'],
+        packingList: [],
+      });
     }
   }
 
@@ -129,21 +122,11 @@ Return as JSON array of strings.
 
       const result = await this.executeAndParseJSON({ prompt });
 
-      return {
-        success: true,
-        data: result || [],
-        metadata: {
-          agentName: 'Weather',
-          timestamp: new Date().toISOString(),
-        },
-      };
+      return this.ok(result || []);
     } catch (error) {
       this.logger.error(`Weather recommendations error: ${error.message}`);
       
-      return {
-        success: false,
-        error: error.message,
-      };
+      return this.fail(error.message);
     }
   }
 }
@@ -0,0 +1,73 @@
+import { ArgumentMetadata, BadRequestException } from '@nestjs/common';
+import { createValidationPipe } from '../../../common/pipes';
+import {
+  DirectionsQueryDto,
+  MapsBatchRequestDto,
+  PlaceBatchParamsDto,
+  SearchPlacesDto,
+  TravelMode,
+} from '.';
+
+describe('MapsBatchRequestDto', () => {
+  const pipe = createValidationPipe();
+  const metadata: ArgumentMetadata = { type: 'body', metatype: MapsBatchRequestDto };
+
+  const validationMessages = async (body: object): Promise<string[]> => {
+    const error = await pipe.transform(body, metadata).catch((e) => e);
+    expect(error).toBeInstanceOf(BadRequestException);
+
+    return ((error as BadRequestException).getResponse() as { message: string[] }).message;
+  };
+
+  it('should build params as the DTO of each operation type', async () => {
+    const body: MapsBatchRequestDto = await pipe.transform(
+      {
+        requests: [
+          { type: 'search', params: { query: 'cafe', radius: '3000' } },
+          { type: 'place', params: { placeId: 'node/123' } },
+          {
+            type: 'directions',
+            params: { origin: 'Berlin', destination: 'Hamburg', waypoints: 'Potsdam, Schwerin' },
+          },
+        ],
+      },
+      metadata,
+    );
+
+    const [search, place, directions] = body.requests.map((item) => item.params);
+    expect(search).toBeInstanceOf(SearchPlacesDto);
+    expect(search).toMatchObject({ query: 'cafe', radius: 3000, source: 'osm' });
+    expect(place).toBeInstanceOf(PlaceBatchParamsDto);
+    expect(place).toMatchObject({ placeId: 'node/123' });
+    expect(directions).toBeInstanceOf(DirectionsQueryDto);
+    expect(directions).toMatchObject({
+      mode: TravelMode.DRIVING,
+      waypoints: ['Potsdam', 'Schwerin'],
+    });
+  });
+
+  it('should reject an unknown operation type', async () => {
+    const messages = await validationMessages({
+      requests: [{ type: 'geocode', params: { query: 'cafe' } }],
+    });
+
+    expect(messages).toContainEqual(expect.stringContaining('requests.0.type'));
+  });
+
+  it('should validate params against the DTO of the operation', async () => {
+    const messages = await validationMessages({
+      requests: [
+        { type: 'search', params: { query: 'cafe' } },
+        {
+          type: 'directions',
+          params: { origin: 'Berlin', destination: 'Hamburg', mode: 'teleport' },
+        },
+        { type: 'place', params: {} },
+      ],
+    });
+
+    expect(messages).toContainEqual(expect.stringContaining('requests.1.params.mode'));
+    expect(messages).toContainEqual(expect.stringContaining('requests.2.params.placeId'));
+    expect(messages).not.toContainEqual(expect.stringContaining('requests.0'));
+  });
+});
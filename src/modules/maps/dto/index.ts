@@ -1,11 +1,37 @@
-import { IsString, IsNumber, IsOptional, Min, Max, IsEnum } from 'class-validator';
-import { Type } from 'class-transformer';
+import {
+  IsString,
+  IsNumber,
+  IsOptional,
+  Min,
+  Max,
+  IsIn,
+  IsArray,
+  IsObject,
+  ArrayMinSize,
+  ArrayMaxSize,
+  ValidateNested,
+  isObject,
+} from 'class-validator';
+import { Transform, Type, plainToInstance } from 'class-transformer';
 
 export enum MapsSource {
   OSM = 'osm',
   ALL = 'all',
 }
 
+// Allowed enum values, listed once for the hot query validators instead of being
+// re-derived from the enum per check
+const MAPS_SOURCES: readonly MapsSource[] = Object.freeze(Object.values(MapsSource));
+
+export enum TravelMode {
+  DRIVING = 'driving',
+  WALKING = 'walking',
+  BICYCLING = 'bicycling',
+  TRANSIT = 'transit',
+}
+
+const TRAVEL_MODES: readonly TravelMode[] = Object.freeze(Object.values(TravelMode));
+
 export class SearchPlacesDto {
   @IsString()
   query: string;
@@ -28,7 +54,7 @@ export class SearchPlacesDto {
   @Max(50000)
   radius?: number;
 
-  @IsEnum(MapsSource)
+  @IsIn(MAPS_SOURCES)
   @IsOptional()
   source?: MapsSource = MapsSource.OSM;
 }
@@ -46,11 +72,69 @@ export class DirectionsQueryDto {
   @IsString()
   destination: string;
 
-  @IsString()
+  @IsIn(TRAVEL_MODES)
   @IsOptional()
-  mode?: string = 'driving';
+  mode?: TravelMode = TravelMode.DRIVING;
 
-  @IsString()
+  // Comma-separated list of addresses in the query string; split once while the
+  // DTO is built so the handler and validators get a ready list
+  @Transform(({ value }) =>
+    typeof value === 'string'
+      ? value
+          .split(',')
+          .map((waypoint) => waypoint.trim())
+          .filter(Boolean)
+      : value,
+  )
+  @IsArray()
+  @IsString({ each: true })
   @IsOptional()
-  waypoints?: string; // Comma-separated list of addresses
+  waypoints?: string[];
+}
+
+export enum MapsBatchOperation {
+  SEARCH = 'search',
+  PLACE = 'place',
+  DIRECTIONS = 'directions',
+}
+
+const MAPS_BATCH_OPERATIONS: readonly MapsBatchOperation[] = Object.freeze(
+  Object.values(MapsBatchOperation),
+);
+
+export class PlaceBatchParamsDto extends PlaceDetailsQueryDto {
+  @IsString()
+  placeId: string;
+}
+
+// Params of each batch operation are the DTO of the matching GET endpoint, so a
+// batch item gets the same validation and defaults as the single request
+const BATCH_PARAMS_TYPES: Record<MapsBatchOperation, new () => object> = {
+  [MapsBatchOperation.SEARCH]: SearchPlacesDto,
+  [MapsBatchOperation.PLACE]: PlaceBatchParamsDto,
+  [MapsBatchOperation.DIRECTIONS]: DirectionsQueryDto,
+};
+
+export class MapsBatchItemDto {
+  @IsIn(MAPS_BATCH_OPERATIONS)
+  type: MapsBatchOperation;
+
+  // Unknown types are left as sent and rejected by the type check above
+  @Transform(({ value, obj, options }) =>
+    MAPS_BATCH_OPERATIONS.includes(obj.type) && isObject(value)
+      ? plainToInstance(BATCH_PARAMS_TYPES[obj.type as MapsBatchOperation], value, options)
+      : value,
+  )
+  @IsObject()
+  @ValidateNested()
+  params: SearchPlacesDto | PlaceBatchParamsDto | DirectionsQueryDto;
+}
+
+export class MapsBatchRequestDto {
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(20)
+  @ValidateNested({ each: true })
+  @Type(() => MapsBatchItemDto)
+  requests: MapsBatchItemDto[];
 }
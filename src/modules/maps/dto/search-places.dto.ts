@@ -1 +0,0 @@
-// Placeholder file
@@ -1,17 +1,25 @@
 import {
   Controller,
   Get,
+  Post,
+  Body,
   Query,
   Param,
   HttpCode,
   HttpStatus,
   Logger,
 } from '@nestjs/common';
-import { ApiTags, ApiOperation, ApiQuery, ApiResponse } from '@nestjs/swagger';
-import { MapsService } from './maps.service';
+import { ApiTags, ApiOperation, ApiQuery, ApiResponse, ApiBody } from '@nestjs/swagger';
+import { MapsService, IMapsBatchResult } from './maps.service';
 import { SearchResultDto } from '../../models/base/search-result.dto';
 import { PlaceDetailsDto } from '../../models/base/place-details.dto';
-import { SearchPlacesDto, PlaceDetailsQueryDto, DirectionsQueryDto } from './dto';
+import {
+  SearchPlacesDto,
+  PlaceDetailsQueryDto,
+  DirectionsQueryDto,
+  TravelMode,
+  MapsBatchRequestDto,
+} from './dto';
 
 /**
  * Maps Controller
@@ -44,9 +52,9 @@ export class MapsController {
   })
   @ApiResponse({ status: 400, description: 'Bad request - invalid parameters' })
   @ApiResponse({ status: 500, description: 'Internal server error' })
-  async searchPlaces(@Query() query: SearchPlacesDto): Promise<SearchResultDto> {
+  searchPlaces(@Query() query: SearchPlacesDto): Promise<SearchResultDto> {
     this.logger.log(`Search request: ${query.query}`);
-    return await this.mapsService.searchPlaces(query);
+    return this.mapsService.searchPlaces(query);
   }
 
   /**
@@ -71,12 +79,12 @@ export class MapsController {
   })
   @ApiResponse({ status: 404, description: 'Place not found' })
   @ApiResponse({ status: 500, description: 'Internal server error' })
-  async getPlaceDetails(
+  getPlaceDetails(
     @Param('placeId') placeId: string,
     @Query() query: PlaceDetailsQueryDto,
   ): Promise<PlaceDetailsDto> {
     this.logger.log(`Place details request: ${placeId} (source: ${query.source})`);
-    return await this.mapsService.getPlaceDetails(placeId, query.source);
+    return this.mapsService.getPlaceDetails(placeId, query.source);
   }
 
   /**
@@ -89,7 +97,7 @@ export class MapsController {
   })
   @ApiQuery({ name: 'origin', required: true, type: String, description: 'Starting point address' })
   @ApiQuery({ name: 'destination', required: true, type: String, description: 'Destination address' })
-  @ApiQuery({ name: 'mode', required: false, type: String, description: 'Travel mode (driving, walking, bicycling, transit)' })
+  @ApiQuery({ name: 'mode', required: false, enum: TravelMode, description: 'Travel mode' })
   @ApiQuery({ name: 'waypoints', required: false, type: String, description: 'Comma-separated list of waypoint addresses' })
   @ApiResponse({ 
     status: 200, 
@@ -98,17 +106,32 @@ export class MapsController {
   @ApiResponse({ status: 400, description: 'Bad request - invalid parameters' })
   @ApiResponse({ status: 404, description: 'Route not found' })
   @ApiResponse({ status: 500, description: 'Internal server error' })
-  async getDirections(@Query() query: DirectionsQueryDto) {
+  getDirections(@Query() query: DirectionsQueryDto) {
     this.logger.log(`Directions request: ${query.origin} to ${query.destination}`);
-    
-    // Parse waypoints from comma-separated string to array
-    const waypoints = query.waypoints ? query.waypoints.split(',').map(wp => wp.trim()) : undefined;
-    
-    return await this.mapsService.getDirections({
+
+    return this.mapsService.getDirections({
       origin: query.origin,
       destination: query.destination,
       mode: query.mode,
-      waypoints,
+      waypoints: query.waypoints,
     });
   }
+
+  /**
+   * Run several maps requests in one round-trip
+   */
+  @Post('batch')
+  @HttpCode(HttpStatus.OK)
+  @ApiOperation({
+    summary: 'Batch maps requests',
+    description:
+      'Run up to 20 search, place and directions requests concurrently. Results are returned in request order, each with its own success flag',
+  })
+  @ApiBody({ type: MapsBatchRequestDto })
+  @ApiResponse({ status: 200, description: 'One result per request, in request order' })
+  @ApiResponse({ status: 400, description: 'Bad request - invalid parameters' })
+  batch(@Body() body: MapsBatchRequestDto): Promise<IMapsBatchResult[]> {
+    this.logger.log(`Batch request: ${body.requests.length} operations`);
+    return this.mapsService.runBatch(body.requests);
+  }
 }
@@ -2,8 +2,6 @@ import { Module } from '@nestjs/common';
 import { ConfigModule } from '@nestjs/config';
 import { MapsController } from './maps.controller';
 import { MapsService } from './maps.service';
-import { MapsProvider } from './maps.provider';
-import { OSMRepository } from '../repositories/maps/osm.repository';
 
 /**
  * Maps Module
@@ -12,11 +10,7 @@ import { OSMRepository } from '../repositories/maps/osm.repository';
 @Module({
   imports: [ConfigModule],
   controllers: [MapsController],
-  providers: [
-    MapsService,
-    MapsProvider,
-    OSMRepository,
-  ],
+  providers: [MapsService],
   exports: [MapsService],
 })
 export class MapsModule {}
@@ -0,0 +1,97 @@
+import { ConfigService } from '@nestjs/config';
+import { MapsService } from './maps.service';
+import { OSMRepository } from '../repositories/maps/osm.repository';
+import {
+  DirectionsQueryDto,
+  MapsBatchItemDto,
+  MapsBatchOperation,
+  PlaceBatchParamsDto,
+  SearchPlacesDto,
+} from './dto';
+
+const item = (type: MapsBatchOperation, params: object): MapsBatchItemDto =>
+  Object.assign(new MapsBatchItemDto(), { type, params });
+
+describe('MapsService', () => {
+  describe('runBatch', () => {
+    let osmRepository: {
+      searchPlaces: jest.Mock;
+      getPlaceDetails: jest.Mock;
+      getDirections: jest.Mock;
+      geocode: jest.Mock;
+    };
+    let service: MapsService;
+
+    beforeEach(() => {
+      osmRepository = {
+        searchPlaces: jest.fn().mockResolvedValue({ items: [], totalCount: 0, hasMore: false }),
+        getPlaceDetails: jest.fn().mockResolvedValue({ id: 'node/123' }),
+        getDirections: jest.fn().mockResolvedValue({ distance: 1000 }),
+        geocode: jest.fn(),
+      };
+      service = new MapsService({} as ConfigService, osmRepository as unknown as OSMRepository);
+    });
+
+    it('should dispatch each item by its params class', async () => {
+      const results = await service.runBatch([
+        item(
+          MapsBatchOperation.SEARCH,
+          Object.assign(new SearchPlacesDto(), { query: 'cafe', radius: 3000 }),
+        ),
+        item(
+          MapsBatchOperation.PLACE,
+          Object.assign(new PlaceBatchParamsDto(), { placeId: 'node/123' }),
+        ),
+        item(
+          MapsBatchOperation.DIRECTIONS,
+          Object.assign(new DirectionsQueryDto(), {
+            origin: '52.52,13.405',
+            destination: '53.55,9.993',
+          }),
+        ),
+      ]);
+
+      expect(results.every((result) => result.success)).toBe(true);
+      expect(osmRepository.searchPlaces).toHaveBeenCalledWith(
+        expect.objectContaining({ query: 'cafe', filters: { radius: 3000, limit: 20 } }),
+      );
+      expect(osmRepository.getPlaceDetails).toHaveBeenCalledWith('node/123');
+      expect(osmRepository.getDirections).toHaveBeenCalledWith(
+        expect.objectContaining({ latitude: 52.52, longitude: 13.405 }),
+        expect.objectContaining({ latitude: 53.55, longitude: 9.993 }),
+        'driving',
+        undefined,
+      );
+      expect(osmRepository.geocode).not.toHaveBeenCalled();
+    });
+
+    it('should reject params that are not an operation DTO', async () => {
+      const [result] = await service.runBatch([item(MapsBatchOperation.SEARCH, { query: 'cafe' })]);
+
+      expect(result).toEqual({ success: false, error: 'Unknown batch operation: search' });
+      expect(osmRepository.searchPlaces).not.toHaveBeenCalled();
+    });
+
+    it('should keep request order and report a failing item in its own slot', async () => {
+      // The failing item settles before the first one, so the order comes from the requests
+      osmRepository.getPlaceDetails.mockImplementation(
+        (placeId: string) =>
+          new Promise((resolve, reject) =>
+            placeId === 'missing'
+              ? reject(new Error('not found'))
+              : setTimeout(() => resolve({ id: placeId }), 10),
+          ),
+      );
+      const place = (placeId: string) =>
+        item(MapsBatchOperation.PLACE, Object.assign(new PlaceBatchParamsDto(), { placeId }));
+
+      const results = await service.runBatch([place('node/1'), place('missing'), place('node/3')]);
+
+      expect(results).toEqual([
+        { success: true, data: { id: 'node/1' } },
+        { success: false, error: 'Failed to get place details: not found' },
+        { success: true, data: { id: 'node/3' } },
+      ]);
+    });
+  });
+});
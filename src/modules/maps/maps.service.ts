@@ -5,6 +5,13 @@ import { ILocation } from '../repositories/base.repository';
 import { IRoute } from '../repositories/maps/base-maps.repository';
 import { PlaceDetailsDto } from '../../models/base/place-details.dto';
 import { SearchResultDto } from '../../models/base/search-result.dto';
+import { parseLatLng } from '../../common/utils/helpers';
+import {
+  DirectionsQueryDto,
+  MapsBatchItemDto,
+  PlaceBatchParamsDto,
+  SearchPlacesDto,
+} from './dto';
 
 export interface ISearchPlacesOptions {
   query: string;
@@ -21,6 +28,12 @@ export interface IDirectionsOptions {
   waypoints?: string[];
 }
 
+export interface IMapsBatchResult {
+  success: boolean;
+  data?: any;
+  error?: string;
+}
+
 /**
  * Maps service - business logic for maps operations
  */
@@ -107,12 +120,48 @@ export class MapsService {
     }
   }
 
+  /**
+   * Run several maps operations concurrently, returning results in request order
+   * A failing operation is reported in its own slot and does not fail the batch
+   */
+  async runBatch(items: MapsBatchItemDto[]): Promise<IMapsBatchResult[]> {
+    const settled = await Promise.allSettled(items.map((item) => this.runBatchItem(item)));
+
+    return settled.map((result) =>
+      result.status === 'fulfilled'
+        ? { success: true, data: result.value }
+        : { success: false, error: result.reason?.message || String(result.reason) },
+    );
+  }
+
+  // Validation builds params as the DTO of the item's operation, so the params
+  // class identifies the operation and narrows its type
+  private runBatchItem({ type, params }: MapsBatchItemDto): Promise<any> {
+    if (params instanceof SearchPlacesDto) {
+      return this.searchPlaces(params);
+    }
+    if (params instanceof PlaceBatchParamsDto) {
+      return this.getPlaceDetails(params.placeId, params.source);
+    }
+    if (params instanceof DirectionsQueryDto) {
+      return this.getDirections(params);
+    }
+
+    return Promise.reject(new Error(`Unknown batch operation: ${type}`));
+  }
+
   /**
    * Geocode a location string to coordinates
    */
   private async geocodeLocation(location: string): Promise<ILocation> {
+    // Coordinates need no lookup
+    const coordinates = parseLatLng(location);
+    if (coordinates) {
+      return { ...coordinates, address: location };
+    }
+
     // Use OSM (free, no API key required)
-    return await this.osmRepository.geocode(location);
+    return this.osmRepository.geocode(location);
   }
 
   /**
@@ -121,8 +170,9 @@ export class MapsService {
   private async searchOSM(options: ISearchPlacesOptions): Promise<SearchResultDto> {
     const results = await this.osmRepository.searchPlaces({
       query: options.query,
+      // 0 is a valid coordinate (equator / prime meridian), so only skip missing values
       location:
-        options.latitude && options.longitude
+        options.latitude != null && options.longitude != null
           ? { latitude: options.latitude, longitude: options.longitude }
           : undefined,
       filters: { radius: options.radius, limit: 20 },
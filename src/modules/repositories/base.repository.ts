@@ -1,6 +1,8 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { ChatOpenAI } from '@langchain/openai';
+import { getSharedChatOpenAI } from '../../common/utils/llm';
+import { extractJson } from '../../common/utils/helpers';
 
 export interface ISearchOptions {
   query: string;
@@ -23,6 +25,11 @@ export interface ILocation {
   placeId?: string;
 }
 
+const PARSE_INSTRUCTIONS =
+  'Parse the content provided by the user into a structured JSON format. ' +
+  'Extract key details like names, addresses, prices, ratings, and amenities. ' +
+  'Return ONLY a valid JSON object, no additional text.';
+
 /**
  * Base repository for all data access layers
  * Provides common LangChain functionality for parsing responses
@@ -40,14 +47,7 @@ export abstract class BaseRepository {
     const deepSeekKey = apiKey || this.configService.get<string>('DEEPSEEK_API_KEY');
 
     if (deepSeekKey) {
-      this.llm = new ChatOpenAI({
-        openAIApiKey: deepSeekKey,
-        modelName,
-        temperature: 0.7,
-        configuration: {
-          baseURL: 'https://api.deepseek.com',
-        },
-      });
+      this.llm = getSharedChatOpenAI(deepSeekKey, modelName, 0.7);
     }
   }
 
@@ -55,23 +55,19 @@ export abstract class BaseRepository {
    * Parse unstructured text into structured data using LLM
    */
   protected async parseWithLLM<T>(content: string): Promise<T> {
-    const prompt = `Parse the following content into a structured JSON format:\n${content}\n\nExtract key details like names, addresses, prices, ratings, and amenities. Return ONLY a valid JSON object, no additional text.`;
-
-    this.logger.debug(`Repository LLM Request: ${prompt}`);
+    this.logger.debug(`Repository LLM Request: ${content}`);
 
+    // Static instructions go first so the provider can reuse the cached prefix
     const response = await this.llm.invoke([
-      ['human', prompt]
+      ['system', PARSE_INSTRUCTIONS],
+      ['human', content],
     ]);
 
     this.logger.debug(`Repository LLM Response: ${response.content}`);
 
     const aiContent = response.content as string;
 
-    // Extract JSON from markdown code blocks if present
-    const jsonMatch = aiContent.match(/```(?:json)?\s*([\s\S]*?)```/);
-    const jsonContent = jsonMatch ? jsonMatch[1].trim() : aiContent;
-
-    return JSON.parse(jsonContent) as T;
+    return extractJson<T>(aiContent);
   }
 
   /**
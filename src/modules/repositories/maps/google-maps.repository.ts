@@ -1,10 +1,13 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import axios, { AxiosInstance } from 'axios';
+import { AxiosInstance } from 'axios';
+import { createHttpClient } from '../../../common/utils/http';
 import { BaseMapsRepository, IRoute, IRouteSegment } from './base-maps.repository';
 import { ISearchOptions, ISearchResult, ILocation } from '../base.repository';
 import { PlaceDetailsDto } from '../../../models/base/place-details.dto';
-import { GeoLocationDto } from '../../../models/base/geo-location.dto';
+
+// HTML tags in Google's step instructions
+const HTML_TAG_PATTERN = /<[^>]*>/g;
 
 @Injectable()
 export class GoogleMapsRepository extends BaseMapsRepository {
@@ -19,7 +22,7 @@ export class GoogleMapsRepository extends BaseMapsRepository {
       this.logger.warn('Google Maps API key not configured');
     }
 
-    this.httpClient = axios.create({
+    this.httpClient = createHttpClient({
       baseURL: 'https://maps.googleapis.com/maps/api',
       params: { key: apiKey },
     });
@@ -135,34 +138,36 @@ export class GoogleMapsRepository extends BaseMapsRepository {
   }
 
   protected transformRoute(routeData: any): IRoute {
-    const segments: IRouteSegment[] = routeData.legs.map((leg: any) => ({
-      startLocation: {
-        latitude: leg.start_location.lat,
-        longitude: leg.start_location.lng,
-        address: leg.start_address,
-      },
-      endLocation: {
-        latitude: leg.end_location.lat,
-        longitude: leg.end_location.lng,
-        address: leg.end_address,
-      },
-      distance: leg.distance.value,
-      duration: leg.duration.value / 60, // seconds to minutes
-      polyline: leg.steps.map((s: any) => s.polyline?.points || '').join(''),
-      instructions: leg.steps.map((s: any) => 
-        s.html_instructions.replace(/<[^>]*>/g, '') // Strip HTML tags
-      ),
-    }));
-
-    const totalDistance = routeData.legs.reduce(
-      (sum: number, leg: any) => sum + leg.distance.value,
-      0,
-    );
-
-    const totalDuration = routeData.legs.reduce(
-      (sum: number, leg: any) => sum + leg.duration.value / 60,
-      0,
-    );
+    // Build segments and accumulate totals in a single pass over the legs
+    const segments: IRouteSegment[] = [];
+    let totalDistance = 0;
+    let totalDuration = 0;
+
+    for (const leg of routeData.legs) {
+      const distance = leg.distance.value;
+      const duration = leg.duration.value / 60; // seconds to minutes
+      totalDistance += distance;
+      totalDuration += duration;
+
+      segments.push({
+        startLocation: {
+          latitude: leg.start_location.lat,
+          longitude: leg.start_location.lng,
+          address: leg.start_address,
+        },
+        endLocation: {
+          latitude: leg.end_location.lat,
+          longitude: leg.end_location.lng,
+          address: leg.end_address,
+        },
+        distance,
+        duration,
+        polyline: leg.steps.map((s: any) => s.polyline?.points || '').join(''),
+        instructions: leg.steps.map((s: any) => 
+          s.html_instructions.replace(HTML_TAG_PATTERN, '') // Strip HTML tags
+        ),
+      });
+    }
 
     return {
       segments,
@@ -216,7 +221,11 @@ export class GoogleMapsRepository extends BaseMapsRepository {
     return {
       id: placeData.place_id,
       name: placeData.name,
-      location: new GeoLocationDto(),
+      location: {
+        latitude: placeData.geometry?.location?.lat,
+        longitude: placeData.geometry?.location?.lng,
+        address: placeData.formatted_address,
+      },
       description: placeData.formatted_address,
       rating: placeData.rating,
       reviewsCount: placeData.user_ratings_total,
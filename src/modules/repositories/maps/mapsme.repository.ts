@@ -1,6 +1,7 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import axios, { AxiosInstance } from 'axios';
+import { AxiosInstance } from 'axios';
+import { createHttpClient } from '../../../common/utils/http';
 import { BaseMapsRepository, IRoute } from './base-maps.repository';
 import { ISearchOptions, ISearchResult, ILocation } from '../base.repository';
 import { PlaceDetailsDto } from '../../../models/base/place-details.dto';
@@ -19,7 +20,7 @@ export class MapsMeRepository extends BaseMapsRepository {
     // Maps.me API configuration (placeholder)
     const apiKey = this.configService.get<string>('MAPSME_API_KEY');
 
-    this.httpClient = axios.create({
+    this.httpClient = createHttpClient({
       baseURL: 'https://maps.me/api', // Placeholder URL
       headers: {
         Authorization: apiKey ? `Bearer ${apiKey}` : undefined,
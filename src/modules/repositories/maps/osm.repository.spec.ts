@@ -0,0 +1,100 @@
+import { ConfigService } from '@nestjs/config';
+import { OSMRepository } from './osm.repository';
+
+describe('OSMRepository', () => {
+  let repository: OSMRepository;
+  let httpClient: { get: jest.Mock };
+  let osrmClient: { get: jest.Mock };
+
+  const berlin = { latitude: 52.52, longitude: 13.405 };
+  const hamburg = { latitude: 53.551, longitude: 9.994 };
+  // Built per call: the repository swaps and freezes the coordinates it receives
+  const osrmResponse = () => ({
+    data: {
+      routes: [
+        {
+          distance: 289000,
+          duration: 10800,
+          geometry: {
+            coordinates: [
+              [13.405, 52.52],
+              [9.994, 53.551],
+            ],
+          },
+        },
+      ],
+    },
+  });
+
+  beforeEach(() => {
+    repository = new OSMRepository({ get: jest.fn() } as unknown as ConfigService);
+    httpClient = { get: jest.fn() };
+    osrmClient = { get: jest.fn() };
+    Object.assign(repository, { httpClient, osrmClient });
+  });
+
+  describe('geocode', () => {
+    it('should serve repeated addresses from the cache', async () => {
+      httpClient.get.mockResolvedValue({
+        data: [{ lat: '52.52', lon: '13.405', display_name: 'Berlin', place_id: 1 }],
+      });
+
+      const first = await repository.geocode('Berlin');
+      const second = await repository.geocode('  berlin ');
+
+      expect(second).toBe(first);
+      expect(httpClient.get).toHaveBeenCalledTimes(1);
+    });
+
+    it('should retry an address after a failed lookup', async () => {
+      httpClient.get
+        .mockRejectedValueOnce(new Error('Nominatim down'))
+        .mockResolvedValueOnce({ data: [{ lat: '52.52', lon: '13.405' }] });
+
+      await expect(repository.geocode('Berlin')).rejects.toThrow('Nominatim down');
+      await expect(repository.geocode('Berlin')).resolves.toMatchObject({ latitude: 52.52 });
+      expect(httpClient.get).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('getDirections', () => {
+    it('should share one OSRM request between identical route requests', async () => {
+      osrmClient.get.mockImplementation(async () => osrmResponse());
+
+      const [first, second] = await Promise.all([
+        repository.getDirections(berlin, hamburg, 'car'),
+        repository.getDirections(berlin, hamburg, 'car'),
+      ]);
+
+      expect(second).toBe(first);
+      expect(osrmClient.get).toHaveBeenCalledTimes(1);
+      expect(first.pathPoints).toEqual([
+        [52.52, 13.405],
+        [53.551, 9.994],
+      ]);
+    });
+
+    it('should return a frozen route so callers cannot change the cached copy', async () => {
+      osrmClient.get.mockImplementation(async () => osrmResponse());
+
+      const route = await repository.getDirections(berlin, hamburg, 'car');
+
+      expect(Object.isFrozen(route)).toBe(true);
+      expect(Object.isFrozen(route.pathPoints)).toBe(true);
+      expect(Object.isFrozen(route.pathPoints[0])).toBe(true);
+      expect(Object.isFrozen(route.segments[0])).toBe(true);
+    });
+
+    it('should cache routes per profile and retry after a failure', async () => {
+      osrmClient.get
+        .mockRejectedValueOnce(new Error('OSRM down'))
+        .mockImplementation(async () => osrmResponse());
+
+      await expect(repository.getDirections(berlin, hamburg, 'car')).rejects.toThrow('OSRM down');
+      await repository.getDirections(berlin, hamburg, 'car');
+      await repository.getDirections(berlin, hamburg, 'foot');
+
+      expect(osrmClient.get).toHaveBeenCalledTimes(3);
+    });
+  });
+});
@@ -1,10 +1,17 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import axios, { AxiosInstance } from 'axios';
+import { AxiosInstance } from 'axios';
+import { createHttpClient } from '../../../common/utils/http';
+import { TtlCache } from '../../../common/utils/ttl-cache';
 import { BaseMapsRepository, IRoute, IRouteSegment } from './base-maps.repository';
 import { ISearchOptions, ISearchResult, ILocation } from '../base.repository';
 import { PlaceDetailsDto } from '../../../models/base/place-details.dto';
-import { GeoLocationDto } from '../../../models/base/geo-location.dto';
+
+// The road network changes slowly, so popular origin/destination pairs can be reused briefly
+const ROUTE_CACHE_TTL_MS = 3 * 60 * 1000;
+
+// Addresses almost never move, and Nominatim's usage policy asks clients to cache results
+const GEOCODE_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
 
 /**
  * OpenStreetMap (OSM) repository using Nominatim API
@@ -13,19 +20,43 @@ import { GeoLocationDto } from '../../../models/base/geo-location.dto';
 @Injectable()
 export class OSMRepository extends BaseMapsRepository {
   private readonly httpClient: AxiosInstance;
+  private readonly osrmClient: AxiosInstance;
+  // Pending or resolved routes keyed by OSRM profile and coordinates
+  private readonly routeCache = new TtlCache<string, Promise<IRoute>>(ROUTE_CACHE_TTL_MS, 1024);
+  // Pending or resolved geocoding results keyed by normalized address
+  private readonly geocodeCache = new TtlCache<string, Promise<ILocation>>(
+    GEOCODE_CACHE_TTL_MS,
+    4096,
+  );
 
   constructor(protected readonly configService: ConfigService) {
     super(configService);
 
-    this.httpClient = axios.create({
+    this.httpClient = createHttpClient({
       baseURL: 'https://nominatim.openstreetmap.org',
       headers: {
         'User-Agent': 'Wayfare/1.0',
       },
     });
+
+    // OSM routing via OSRM (Open Source Routing Machine)
+    this.osrmClient = createHttpClient({
+      baseURL: 'http://router.project-osrm.org',
+      headers: {
+        'User-Agent': 'Wayfare/1.0',
+      },
+    });
+  }
+
+  /**
+   * Geocode an address, serving repeated addresses from memory
+   */
+  geocode(address: string): Promise<ILocation> {
+    const key = address.trim().toLowerCase();
+    return this.geocodeCache.getOrCreate(key, () => this.fetchGeocode(address));
   }
 
-  async geocode(address: string): Promise<ILocation> {
+  private async fetchGeocode(address: string): Promise<ILocation> {
     try {
       this.logger.log(`Geocoding address: "${address}"`);
       const response = await this.httpClient.get('/search', {
@@ -50,7 +81,7 @@ export class OSMRepository extends BaseMapsRepository {
     }
   }
 
-  async getDirections(
+  getDirections(
     origin: ILocation,
     destination: ILocation,
     mode: string = 'driving',
@@ -59,15 +90,24 @@ export class OSMRepository extends BaseMapsRepository {
     // OSM routing via OSRM (Open Source Routing Machine)
     // OSRM expects coordinates in longitude,latitude;longitude,latitude format
     const coordinates = `${origin.longitude},${origin.latitude};${destination.longitude},${destination.latitude}`;
+    const key = `${mode}/${coordinates}`;
 
+    return this.routeCache.getOrCreate(key, () =>
+      this.fetchRoute(origin, destination, mode, coordinates),
+    );
+  }
+
+  private async fetchRoute(
+    origin: ILocation,
+    destination: ILocation,
+    mode: string,
+    coordinates: string,
+  ): Promise<IRoute> {
     try {
       this.logger.log(`Requesting OSRM route: ${mode}/${coordinates}`);
-      const response = await axios.get(
-        `http://router.project-osrm.org/route/v1/${mode}/${coordinates}`,
-        {
-          params: { overview: 'full', geometries: 'geojson' },
-        },
-      );
+      const response = await this.osrmClient.get(`/route/v1/${mode}/${coordinates}`, {
+        params: { overview: 'full', geometries: 'geojson' },
+      });
 
       if (!response.data.routes || response.data.routes.length === 0) {
         throw new Error('No route found');
@@ -85,20 +125,23 @@ export class OSMRepository extends BaseMapsRepository {
 
   async searchPlaces(options: ISearchOptions): Promise<ISearchResult> {
     try {
-      const response = await this.httpClient.get('/search', {
-        params: {
-          q: options.query,
-          format: 'json',
-          limit: options.filters?.limit || 20,
-          ...(options.location && {
-            viewbox: `${options.location.longitude - 0.1},${options.location.latitude + 0.1},${options.location.longitude + 0.1},${options.location.latitude - 0.1}`,
-            bounded: 1,
-          }),
-        },
-      });
+      // Assemble the query in a single object rather than spreading an optional
+      // viewbox fragment into a fresh one on every search
+      const params: Record<string, string | number> = {
+        q: options.query,
+        format: 'json',
+        limit: options.filters?.limit || 20,
+      };
+      const location = options.location;
+      if (location) {
+        params.viewbox = `${location.longitude - 0.1},${location.latitude + 0.1},${location.longitude + 0.1},${location.latitude - 0.1}`;
+        params.bounded = 1;
+      }
+
+      const response = await this.httpClient.get('/search', { params });
 
       return {
-        items: response.data.map(this.transformPlace.bind(this)),
+        items: response.data.map((place: any) => this.transformPlace(place)),
         totalCount: response.data.length,
         hasMore: false,
       };
@@ -112,17 +155,14 @@ export class OSMRepository extends BaseMapsRepository {
     try {
       // OSM Details API
       const [osmType, osmId] = placeId.split('/');
-      const response = await axios.get(
-        `https://nominatim.openstreetmap.org/details`,
-        {
-          params: {
-            osmtype: osmType,
-            osmid: osmId,
-            format: 'json',
-            addressdetails: 1,
-          },
+      const response = await this.httpClient.get('/details', {
+        params: {
+          osmtype: osmType,
+          osmid: osmId,
+          format: 'json',
+          addressdetails: 1,
         },
-      );
+      });
 
       return this.transformPlaceDetails(response.data);
     } catch (error) {
@@ -150,37 +190,37 @@ export class OSMRepository extends BaseMapsRepository {
 
   protected transformRoute(routeData: any, origin: ILocation, destination: ILocation): IRoute {
     const geometry = routeData.geometry;
-    const legs: any[] = [];
 
-    // OSRM returns a single route, we need to create segments
-    legs.push({
-      distance: routeData.distance,
-      duration: routeData.duration / 60, // seconds to minutes
-      steps: [],
-    });
-
-    const segments: IRouteSegment[] = [
-      {
+    // The route is cached and shared by every caller, so it is frozen here: a
+    // caller that modifies it gets an error instead of changing later results.
+    // OSRM returns a single route, so it becomes a single segment
+    const segments: IRouteSegment[] = Object.freeze([
+      Object.freeze({
         startLocation: origin,
         endLocation: destination,
         distance: routeData.distance,
-        duration: routeData.duration / 60,
+        duration: routeData.duration / 60, // seconds to minutes
         polyline: '',
-        instructions: [],
-      },
-    ];
+        instructions: Object.freeze([]) as string[],
+      }),
+    ]) as IRouteSegment[];
 
-    const pathPoints = geometry?.coordinates?.map((coord: number[]) => [
-      coord[1],
-      coord[0],
-    ]) || [];
+    // GeoJSON coordinates are [lon, lat]; swap each pair in place rather than
+    // allocating a second array per point of a full-overview geometry
+    const pathPoints: number[][] = geometry?.coordinates || [];
+    for (const coord of pathPoints) {
+      const longitude = coord[0];
+      coord[0] = coord[1];
+      coord[1] = longitude;
+      Object.freeze(coord);
+    }
 
-    return {
+    return Object.freeze({
       segments,
       totalDistance: routeData.distance,
       totalDuration: routeData.duration / 60,
-      pathPoints,
-    };
+      pathPoints: Object.freeze(pathPoints) as number[][],
+    });
   }
 
   protected transformPlace(placeData: any): PlaceDetailsDto {
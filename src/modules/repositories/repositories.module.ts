@@ -1,5 +1,6 @@
-import { Module, Global } from '@nestjs/common';
+import { Module, Global, OnApplicationShutdown } from '@nestjs/common';
 import { ConfigModule } from '@nestjs/config';
+import { httpAgent, httpsAgent } from '../../common/utils/http';
 import { OSMRepository } from './maps/osm.repository';
 import { MapsMeRepository } from './maps/mapsme.repository';
 import { BookingRepository } from './travel/booking.repository';
@@ -37,4 +38,12 @@ import { OpenWeatherRepository } from './weather/open-weather.repository';
     OpenWeatherRepository,
   ],
 })
-export class RepositoriesModule {}
+export class RepositoriesModule implements OnApplicationShutdown {
+  /**
+   * Close the pooled keep-alive sockets shared by all repository HTTP clients
+   */
+  onApplicationShutdown(): void {
+    httpAgent.destroy();
+    httpsAgent.destroy();
+  }
+}
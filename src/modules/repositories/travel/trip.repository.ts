@@ -1,6 +1,7 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import axios, { AxiosInstance } from 'axios';
+import { AxiosInstance } from 'axios';
+import { createHttpClient } from '../../../common/utils/http';
 import { BaseRepository, ISearchOptions, ISearchResult } from '../base.repository';
 
 export interface ITripAdvisorLocation {
@@ -28,7 +29,7 @@ export class TripRepository extends BaseRepository {
 
     const apiKey = this.configService.get<string>('TRIP_API_KEY');
 
-    this.httpClient = axios.create({
+    this.httpClient = createHttpClient({
       baseURL: 'https://api.tripadvisor.com/api/partner/2.0',
       headers: {
         'X-TripAdvisor-API-Key': apiKey || '',
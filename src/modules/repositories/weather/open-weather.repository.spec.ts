@@ -0,0 +1,63 @@
+import { ConfigService } from '@nestjs/config';
+import { OpenWeatherRepository } from './open-weather.repository';
+
+const weatherData = {
+  name: 'Berlin',
+  dt: 1700000000,
+  main: { temp: 10, feels_like: 8, humidity: 70, pressure: 1012 },
+  weather: [{ description: 'clear sky', icon: '01d' }],
+  wind: { speed: 3, deg: 180 },
+  clouds: { all: 0 },
+};
+
+describe('OpenWeatherRepository', () => {
+  let repository: OpenWeatherRepository;
+  let httpClient: { get: jest.Mock };
+
+  beforeEach(() => {
+    repository = new OpenWeatherRepository({ get: jest.fn() } as unknown as ConfigService);
+    httpClient = { get: jest.fn() };
+    Object.assign(repository, { httpClient });
+  });
+
+  describe('getCurrentWeather', () => {
+    it('should share a cache entry between points ~100 m apart', async () => {
+      httpClient.get.mockResolvedValue({ data: weatherData });
+
+      const first = await repository.getCurrentWeather(52.52001, 13.40501);
+      const second = await repository.getCurrentWeather(52.52004, 13.40498);
+
+      expect(second).toBe(first);
+      expect(first.location).toBe('Berlin');
+      expect(httpClient.get).toHaveBeenCalledTimes(1);
+    });
+
+    it('should retry a point after a failed request', async () => {
+      httpClient.get
+        .mockRejectedValueOnce(new Error('timeout'))
+        .mockResolvedValueOnce({ data: weatherData });
+
+      await expect(repository.getCurrentWeather(52.52, 13.405)).rejects.toThrow('timeout');
+      await expect(repository.getCurrentWeather(52.52, 13.405)).resolves.toMatchObject({
+        temperature: 10,
+      });
+      expect(httpClient.get).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('getForecast', () => {
+    it('should cache parsed forecasts per point and number of days', async () => {
+      httpClient.get.mockResolvedValue({
+        data: { city: { name: 'Berlin' }, list: [weatherData, weatherData] },
+      });
+
+      const first = await repository.getForecast(52.52, 13.405, 1);
+      const second = await repository.getForecast(52.52, 13.405, 1);
+      await repository.getForecast(52.52, 13.405, 2);
+
+      expect(second).toBe(first);
+      expect(first.forecast).toHaveLength(2);
+      expect(httpClient.get).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -1,6 +1,9 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
-import axios, { AxiosInstance } from 'axios';
+import { AxiosInstance } from 'axios';
+import { createHttpClient } from '../../../common/utils/http';
+import { CircuitBreaker } from '../../../common/utils/circuit-breaker';
+import { TtlCache } from '../../../common/utils/ttl-cache';
 import { BaseRepository, ISearchOptions, ISearchResult } from '../base.repository';
 
 export interface IWeatherData {
@@ -23,12 +26,39 @@ export interface IWeatherForecast {
   forecast: IWeatherData[];
 }
 
+/**
+ * Current weather for a trip: both endpoints plus optional points along the route
+ */
+export interface IRouteWeather {
+  origin: IWeatherData;
+  destination: IWeatherData;
+  waypoints?: IWeatherData[]; // in travel order
+}
+
+// OpenWeather refreshes current conditions roughly every 10 minutes
+const WEATHER_CACHE_TTL_MS = 10 * 60 * 1000;
+
+// Points within ~100 m of each other share a cache entry
+const COORDINATE_KEY_PRECISION = 3;
+
 /**
  * OpenWeatherMap repository for weather data
  */
 @Injectable()
 export class OpenWeatherRepository extends BaseRepository {
   private readonly httpClient: AxiosInstance;
+  // Fail fast while OpenWeather is down instead of waiting out every timeout
+  private readonly breaker = new CircuitBreaker('openweather');
+  // Pending or resolved current weather keyed by rounded coordinates
+  private readonly currentWeatherCache = new TtlCache<string, Promise<IWeatherData>>(
+    WEATHER_CACHE_TTL_MS,
+    1024,
+  );
+  // Parsed forecasts, so cache hits skip both the request and the per-item transform
+  private readonly forecastCache = new TtlCache<string, Promise<IWeatherForecast>>(
+    WEATHER_CACHE_TTL_MS,
+    256,
+  );
 
   constructor(protected readonly configService: ConfigService) {
     super(configService);
@@ -39,7 +69,7 @@ export class OpenWeatherRepository extends BaseRepository {
       this.logger.warn('OpenWeather API key not configured');
     }
 
-    this.httpClient = axios.create({
+    this.httpClient = createHttpClient({
       baseURL: 'https://api.openweathermap.org/data/2.5',
       params: {
         appid: apiKey,
@@ -48,16 +78,21 @@ export class OpenWeatherRepository extends BaseRepository {
     });
   }
 
-  async getCurrentWeather(
-    latitude: number,
-    longitude: number,
-  ): Promise<IWeatherData> {
+  /**
+   * Current weather at a point, served from a short-lived cache for nearby repeats
+   */
+  getCurrentWeather(latitude: number, longitude: number): Promise<IWeatherData> {
+    const key = this.getCoordinateKey(latitude, longitude);
+    return this.currentWeatherCache.getOrCreate(key, () =>
+      this.fetchCurrentWeather(latitude, longitude),
+    );
+  }
+
+  private async fetchCurrentWeather(latitude: number, longitude: number): Promise<IWeatherData> {
     try {
-      const response = await this.httpClient.get('/weather', {
-        params: {
-          lat: latitude,
-          lon: longitude,
-        },
+      const response = await this.request('/weather', {
+        lat: latitude,
+        lon: longitude,
       });
 
       return this.transformWeather(response.data);
@@ -67,18 +102,24 @@ export class OpenWeatherRepository extends BaseRepository {
     }
   }
 
-  async getForecast(
+  /**
+   * Forecast at a point, served already parsed from a short-lived cache
+   */
+  getForecast(latitude: number, longitude: number, days: number = 5): Promise<IWeatherForecast> {
+    const key = `${this.getCoordinateKey(latitude, longitude)}|${days}`;
+    return this.forecastCache.getOrCreate(key, () => this.fetchForecast(latitude, longitude, days));
+  }
+
+  private async fetchForecast(
     latitude: number,
     longitude: number,
-    days: number = 5,
+    days: number,
   ): Promise<IWeatherForecast> {
     try {
-      const response = await this.httpClient.get('/forecast', {
-        params: {
-          lat: latitude,
-          lon: longitude,
-          cnt: days * 8, // API returns data every 3 hours
-        },
+      const response = await this.request('/forecast', {
+        lat: latitude,
+        lon: longitude,
+        cnt: days * 8, // API returns data every 3 hours
       });
 
       const forecast = response.data.list.map((item: any) => 
@@ -102,9 +143,7 @@ export class OpenWeatherRepository extends BaseRepository {
     }
 
     try {
-      const response = await this.httpClient.get('/weather', {
-        params: { q: options.query },
-      });
+      const response = await this.request('/weather', { q: options.query });
 
       return {
         items: [this.transformWeather(response.data)],
@@ -124,9 +163,7 @@ export class OpenWeatherRepository extends BaseRepository {
 
   async getCurrentWeatherByCity(city: string): Promise<IWeatherData> {
     try {
-      const response = await this.httpClient.get('/weather', {
-        params: { q: city },
-      });
+      const response = await this.request('/weather', { q: city });
 
       return this.transformWeather(response.data);
     } catch (error) {
@@ -135,6 +172,14 @@ export class OpenWeatherRepository extends BaseRepository {
     }
   }
 
+  private getCoordinateKey(latitude: number, longitude: number): string {
+    return `${latitude.toFixed(COORDINATE_KEY_PRECISION)},${longitude.toFixed(COORDINATE_KEY_PRECISION)}`;
+  }
+
+  private request(path: string, params: Record<string, any>) {
+    return this.breaker.execute(() => this.httpClient.get(path, { params }));
+  }
+
   private transformWeather(data: any, locationName?: string): IWeatherData {
     return {
       location: locationName || data.name || 'Unknown',
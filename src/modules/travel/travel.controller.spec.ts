@@ -0,0 +1,87 @@
+import { EventEmitter } from 'events';
+import { Response } from 'express';
+import { TravelController } from './travel.controller';
+import { TravelService, TravelPlanEvent } from './travel.service';
+import { TravelRequestDto } from '../../models/travel/travel-request.dto';
+
+/**
+ * Minimal Express response for SSE: an event emitter that records writes
+ */
+function createResponse() {
+  const res = Object.assign(new EventEmitter(), {
+    status: jest.fn(),
+    setHeader: jest.fn(),
+    flushHeaders: jest.fn(),
+    write: jest.fn(),
+    end: jest.fn(),
+  });
+  res.status.mockReturnValue(res);
+
+  return res;
+}
+
+describe('TravelController', () => {
+  describe('planRouteStream', () => {
+    const request = { origin: 'Berlin', destination: 'Hamburg' } as TravelRequestDto;
+
+    let generatorClosed: boolean;
+    let travelService: { planTravelStream: jest.Mock };
+    let controller: TravelController;
+
+    beforeEach(() => {
+      generatorClosed = false;
+      travelService = {
+        planTravelStream: jest.fn(async function* (): AsyncGenerator<TravelPlanEvent> {
+          try {
+            yield { stage: 'route', data: { totalDistance: 1 } };
+            yield { stage: 'costs', data: { totalCost: 2 } };
+            yield { stage: 'stops', data: [] };
+          } finally {
+            generatorClosed = true;
+          }
+        }),
+      };
+      controller = new TravelController(travelService as unknown as TravelService);
+    });
+
+    it('should write every stage as an SSE event and end the response', async () => {
+      const res = createResponse();
+
+      await controller.planRouteStream(request, res as unknown as Response);
+
+      expect(res.setHeader).toHaveBeenCalledWith('Content-Type', 'text/event-stream');
+      expect(res.write.mock.calls.map(([chunk]) => chunk)).toEqual([
+        'event: route\ndata: {"totalDistance":1}\n\n',
+        'event: costs\ndata: {"totalCost":2}\n\n',
+        'event: stops\ndata: []\n\n',
+      ]);
+      expect(res.end).toHaveBeenCalledTimes(1);
+    });
+
+    it('should stop planning once the client disconnects', async () => {
+      const res = createResponse();
+      res.write.mockImplementationOnce(() => res.emit('close'));
+
+      await controller.planRouteStream(request, res as unknown as Response);
+
+      expect(res.write).toHaveBeenCalledTimes(1);
+      expect(generatorClosed).toBe(true);
+      expect(res.end).toHaveBeenCalledTimes(1);
+    });
+
+    it('should report a failure mid-stream as an error event', async () => {
+      travelService.planTravelStream.mockImplementation(async function* () {
+        yield { stage: 'route', data: {} };
+        throw new Error('Routing failed');
+      });
+      const res = createResponse();
+
+      await controller.planRouteStream(request, res as unknown as Response);
+
+      expect(res.write).toHaveBeenLastCalledWith(
+        'event: error\ndata: {"message":"Routing failed"}\n\n',
+      );
+      expect(res.end).toHaveBeenCalledTimes(1);
+    });
+  });
+});
@@ -6,12 +6,13 @@ import {
   HttpStatus,
   Logger,
   HttpException,
+  Res,
 } from '@nestjs/common';
+import { Response } from 'express';
 import { ApiTags, ApiOperation, ApiBody, ApiResponse } from '@nestjs/swagger';
 import { TravelService } from './travel.service';
 import { TravelRequestDto } from '../../models/travel/travel-request.dto';
 import { TravelResponseDto } from '../../models/travel/travel-response.dto';
-import { PlanTravelDto } from './dto/plan-travel.dto';
 
 /**
  * Travel Controller
@@ -82,14 +83,7 @@ export class TravelController {
     this.logger.log(`Travel planning request: ${travelRequest.origin} -> ${travelRequest.destination}`);
 
     try {
-      // Validate request
-      if (!travelRequest.origin || !travelRequest.destination) {
-        throw new HttpException(
-          'Origin and destination are required',
-          HttpStatus.BAD_REQUEST,
-        );
-      }
-
+      // Presence is already enforced by the global ValidationPipe
       if (travelRequest.origin === travelRequest.destination) {
         throw new HttpException(
           'Origin and destination must be different',
@@ -112,4 +106,52 @@ export class TravelController {
       );
     }
   }
+
+  /**
+   * Plan a travel route, streaming each part of the plan as Server-Sent Events
+   */
+  @Post('route/stream')
+  @ApiOperation({
+    summary: 'Stream travel route plan',
+    description:
+      'Plan a travel itinerary and stream route, costs, stops, health, weather and recommendations as Server-Sent Events as soon as each is ready',
+  })
+  @ApiBody({ type: TravelRequestDto })
+  @ApiResponse({
+    status: 200,
+    description: 'text/event-stream with one event per plan stage, or an error event',
+  })
+  async planRouteStream(
+    @Body() travelRequest: TravelRequestDto,
+    @Res() res: Response,
+  ): Promise<void> {
+    if (travelRequest.origin === travelRequest.destination) {
+      throw new HttpException('Origin and destination must be different', HttpStatus.BAD_REQUEST);
+    }
+
+    res.status(HttpStatus.OK);
+    res.setHeader('Content-Type', 'text/event-stream');
+    res.setHeader('Cache-Control', 'no-cache');
+    res.setHeader('Connection', 'keep-alive');
+    res.flushHeaders();
+
+    let closed = false;
+    res.on('close', () => {
+      closed = true;
+    });
+
+    try {
+      for await (const event of this.travelService.planTravelStream(travelRequest)) {
+        if (closed) {
+          break;
+        }
+        res.write(`event: ${event.stage}\ndata: ${JSON.stringify(event.data)}\n\n`);
+      }
+    } catch (error) {
+      this.logger.error(`Travel planning stream error: ${error.message}`);
+      res.write(`event: error\ndata: ${JSON.stringify({ message: error.message })}\n\n`);
+    }
+
+    res.end();
+  }
 }
@@ -3,3 +3,4 @@
  * This file re-exports the actual TravelService from src/services/travel.service.ts
  */
 export { TravelService } from '../../services/travel.service';
+export type { TravelPlanEvent, TravelPlanStage } from '../../services/travel.service';
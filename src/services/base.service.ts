@@ -1,6 +1,8 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { ChatDeepSeek } from '@langchain/deepseek';
+import { getSharedChatDeepSeek } from '../common/utils/llm';
+import { extractJson } from '../common/utils/helpers';
 
 /**
  * Base service for all business logic services
@@ -23,11 +25,7 @@ export abstract class BaseService {
       return;
     }
 
-    this.llm = new ChatDeepSeek({
-      apiKey: apiKey,
-      model: modelName,
-      temperature,
-    });
+    this.llm = getSharedChatDeepSeek(apiKey, modelName, temperature);
   }
 
   /**
@@ -48,12 +46,8 @@ export abstract class BaseService {
     this.logger.debug(`LLM Response: ${response.content}`);
 
     const content = response.content as string;
-    
-    // Extract JSON from markdown code blocks if present
-    const jsonMatch = content.match(/```(?:json)?\s*([\s\S]*?)```/);
-    const jsonContent = jsonMatch ? jsonMatch[1].trim() : content;
-    
-    return JSON.parse(jsonContent);
+
+    return extractJson(content);
   }
 
   /**
@@ -0,0 +1,76 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { ConfigModule } from '@nestjs/config';
+import { SearchService } from './search.service';
+import { GoogleMapsRepository } from '../modules/repositories/maps/google-maps.repository';
+import { OSMRepository } from '../modules/repositories/maps/osm.repository';
+
+describe('SearchService', () => {
+  let service: SearchService;
+  let module: TestingModule;
+
+  beforeEach(async () => {
+    module = await Test.createTestingModule({
+      imports: [ConfigModule.forRoot()],
+      providers: [
+        SearchService,
+        {
+          provide: GoogleMapsRepository,
+          useValue: {
+            searchPlaces: jest.fn(),
+            getPlaceDetails: jest.fn(),
+            geocode: jest.fn(),
+          },
+        },
+        {
+          provide: OSMRepository,
+          useValue: {
+            searchPlaces: jest.fn(),
+            getPlaceDetails: jest.fn(),
+            geocode: jest.fn(),
+          },
+        },
+      ],
+    }).compile();
+
+    service = module.get<SearchService>(SearchService);
+  });
+
+  it('should be defined', () => {
+    expect(service).toBeDefined();
+  });
+
+  describe('searchPlaces', () => {
+    it('should reuse cached results for identical searches', async () => {
+      const osmRepository = module.get(OSMRepository);
+      (osmRepository.searchPlaces as jest.Mock).mockResolvedValue({
+        items: [],
+        totalCount: 0,
+        hasMore: false,
+      });
+
+      const options = { query: 'gas station', latitude: 52.52, longitude: 13.405, radius: 3000 };
+      await Promise.all([service.searchPlaces(options), service.searchPlaces(options)]);
+      await service.searchPlaces(options);
+
+      expect(osmRepository.searchPlaces).toHaveBeenCalledTimes(1);
+    });
+
+    it('should share results between near-identical searches', async () => {
+      const osmRepository = module.get(OSMRepository);
+      (osmRepository.searchPlaces as jest.Mock).mockResolvedValue({
+        items: [],
+        totalCount: 0,
+        hasMore: false,
+      });
+
+      await service.searchPlaces({ query: 'Gas Station', latitude: 52.52001, longitude: 13.40502 });
+      await service.searchPlaces({
+        query: '  gas   station ',
+        latitude: 52.52004,
+        longitude: 13.40498,
+      });
+
+      expect(osmRepository.searchPlaces).toHaveBeenCalledTimes(1);
+    });
+  });
+});
@@ -5,12 +5,24 @@ import { OSMRepository } from '../modules/repositories/maps/osm.repository';
 import { ISearchResult, ILocation } from '../modules/repositories/base.repository';
 import { PlaceDetailsDto } from '../models/base/place-details.dto';
 import { SearchResultDto } from '../models/base/search-result.dto';
+import { TtlCache } from '../common/utils/ttl-cache';
+
+// Places along a route rarely change, so repeated searches can be served from memory
+const SEARCH_CACHE_TTL_MS = 10 * 60 * 1000;
+
+// Searches within ~100 m of each other are treated as the same search
+const COORDINATE_KEY_PRECISION = 3;
+
+const WHITESPACE_PATTERN = /\s+/g;
+
+const DEFAULT_SEARCH_LIMIT = 20;
 
 export interface ISearchPlacesOptions {
   query: string;
   latitude?: number;
   longitude?: number;
   radius?: number;
+  limit?: number;
   source?: 'osm' | 'all';
 }
 
@@ -19,6 +31,12 @@ export interface ISearchPlacesOptions {
  */
 @Injectable()
 export class SearchService extends BaseService {
+  // Pending or resolved searches, so concurrent identical searches share one request
+  private readonly searchCache = new TtlCache<string, Promise<SearchResultDto>>(
+    SEARCH_CACHE_TTL_MS,
+    1000,
+  );
+
   constructor(
     protected readonly configService: ConfigService,
     private readonly osmRepository: OSMRepository,
@@ -27,9 +45,17 @@ export class SearchService extends BaseService {
   }
 
   /**
-   * Search for places across multiple providers
+   * Search for places, serving repeated searches from a short-lived cache
+   */
+  searchPlaces(options: ISearchPlacesOptions): Promise<SearchResultDto> {
+    const key = this.getSearchCacheKey(options);
+    return this.searchCache.getOrCreate(key, () => this.fetchPlaces(options));
+  }
+
+  /**
+   * Search for places across multiple providers, bypassing the cache
    */
-  async searchPlaces(options: ISearchPlacesOptions): Promise<SearchResultDto> {
+  private async fetchPlaces(options: ISearchPlacesOptions): Promise<SearchResultDto> {
     const source = options.source || 'osm';
 
     try {
@@ -57,6 +83,17 @@ export class SearchService extends BaseService {
     }
   }
 
+  /**
+   * Canonical key so near-identical searches (case, spacing, GPS jitter) share one request
+   */
+  private getSearchCacheKey(options: ISearchPlacesOptions): string {
+    const query = options.query.trim().toLowerCase().replace(WHITESPACE_PATTERN, ' ');
+    const latitude = options.latitude?.toFixed(COORDINATE_KEY_PRECISION);
+    const longitude = options.longitude?.toFixed(COORDINATE_KEY_PRECISION);
+
+    return `${options.source || 'osm'}|${query}|${latitude}|${longitude}|${options.radius}|${options.limit || DEFAULT_SEARCH_LIMIT}`;
+  }
+
   /**
    * Get place details from specified or best available source
    */
@@ -76,13 +113,14 @@ export class SearchService extends BaseService {
   private async searchOSM(options: ISearchPlacesOptions): Promise<ISearchResult> {
     return this.osmRepository.searchPlaces({
       query: options.query,
-      location: options.latitude && options.longitude ? {
-        latitude: options.latitude,
-        longitude: options.longitude,
-      } : undefined,
+      // 0 is a valid coordinate (equator / prime meridian), so only skip missing values
+      location:
+        options.latitude != null && options.longitude != null
+          ? { latitude: options.latitude, longitude: options.longitude }
+          : undefined,
       filters: {
         radius: options.radius,
-        limit: 20,
+        limit: options.limit || DEFAULT_SEARCH_LIMIT,
       },
     });
   }
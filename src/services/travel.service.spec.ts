@@ -0,0 +1,172 @@
+import { ConfigService } from '@nestjs/config';
+import { TravelService } from './travel.service';
+import { OSMRepository } from '../modules/repositories/maps/osm.repository';
+import { OpenWeatherRepository } from '../modules/repositories/weather/open-weather.repository';
+import { SearchService } from './search.service';
+import { TravelRequestDto } from '../models/travel/travel-request.dto';
+import { TransportationType } from '../models/travel/transportation-type.enum';
+import { IRoute } from '../modules/repositories/maps/base-maps.repository';
+
+/**
+ * Route made of consecutive segments with the given lengths (km) and durations (minutes)
+ */
+function buildRoute(segments: Array<[number, number]>): IRoute {
+  return {
+    segments: segments.map(([distanceKm, duration], index) => ({
+      startLocation: { latitude: index, longitude: index },
+      endLocation: { latitude: index + 1, longitude: index + 1 },
+      distance: distanceKm * 1000,
+      duration,
+      polyline: '',
+      instructions: [],
+    })),
+    totalDistance: segments.reduce((total, [distanceKm]) => total + distanceKm * 1000, 0),
+    totalDuration: segments.reduce((total, [, duration]) => total + duration, 0),
+    pathPoints: [],
+  };
+}
+
+describe('TravelService', () => {
+  let service: TravelService;
+  let mapsRepository: { geocode: jest.Mock; getDirections: jest.Mock };
+  let searchService: { searchPlaces: jest.Mock };
+
+  beforeEach(() => {
+    mapsRepository = { geocode: jest.fn(), getDirections: jest.fn() };
+    searchService = {
+      searchPlaces: jest.fn().mockResolvedValue({ results: [{ id: 'place' }] }),
+    };
+
+    service = new TravelService(
+      { get: jest.fn() } as unknown as ConfigService,
+      mapsRepository as unknown as OSMRepository,
+      {} as OpenWeatherRepository,
+      searchService as unknown as SearchService,
+    );
+  });
+
+  describe('geocode', () => {
+    it('should use "lat,lng" inputs as coordinates without a lookup', async () => {
+      await expect(service['geocode']('52.52, 13.405')).resolves.toEqual({
+        latitude: 52.52,
+        longitude: 13.405,
+        address: '52.52, 13.405',
+      });
+      expect(mapsRepository.geocode).not.toHaveBeenCalled();
+    });
+
+    it('should geocode addresses', async () => {
+      const berlin = { latitude: 52.52, longitude: 13.405, address: 'Berlin' };
+      mapsRepository.geocode.mockResolvedValue(berlin);
+
+      await expect(service['geocode']('Berlin')).resolves.toBe(berlin);
+      expect(mapsRepository.geocode).toHaveBeenCalledWith('Berlin');
+    });
+  });
+
+  describe('calculateStops', () => {
+    const calculateStops = (transportationType: TransportationType, route: IRoute) =>
+      service['calculateStops']({ transportationType } as TravelRequestDto, route);
+
+    it('should plan nothing for a zero-length route', async () => {
+      const route = buildRoute([[0, 30]]);
+
+      await expect(calculateStops(TransportationType.CAR, route)).resolves.toEqual([]);
+      expect(searchService.searchPlaces).not.toHaveBeenCalled();
+    });
+
+    it('should stop at a segment that ends exactly on the fuel and rest thresholds', async () => {
+      // Cumulative 100..600 km and 30..180 minutes: 500 km and 150 minutes fall on
+      // the end of the fifth segment
+      const route = buildRoute([
+        [100, 30],
+        [100, 30],
+        [100, 30],
+        [100, 30],
+        [100, 30],
+        [100, 30],
+      ]);
+
+      const stops = await calculateStops(TransportationType.CAR, route);
+
+      expect(stops.map((stop) => [stop.type, stop.distanceFromStart])).toEqual([
+        ['fuel', '500.0'],
+        ['rest', '500.0'],
+      ]);
+    });
+
+    it('should stop at the segment that crosses a threshold inside it', async () => {
+      // Cumulative 150, 300, 450, 600 km: the 500 km mark is inside the last segment
+      const route = buildRoute([
+        [150, 20],
+        [150, 20],
+        [150, 20],
+        [150, 20],
+      ]);
+
+      const stops = await calculateStops(TransportationType.CAR, route);
+
+      expect(stops.map((stop) => [stop.type, stop.distanceFromStart])).toEqual([
+        ['fuel', '600.0'],
+      ]);
+    });
+
+    it('should plan a fuel stop for every full tank range', async () => {
+      const route = buildRoute([
+        [250, 10],
+        [250, 10],
+        [250, 10],
+        [250, 10],
+        [250, 10],
+      ]);
+
+      const stops = await calculateStops(TransportationType.CAR, route);
+
+      expect(stops.map((stop) => stop.distanceFromStart)).toEqual(['500.0', '1000.0']);
+    });
+
+    it('should not plan fuel stops for human-powered transport', async () => {
+      const route = buildRoute([
+        [100, 30],
+        [500, 30],
+      ]);
+
+      await expect(calculateStops(TransportationType.BICYCLE, route)).resolves.toEqual([]);
+    });
+
+    it('should skip stops without a matching place', async () => {
+      searchService.searchPlaces.mockResolvedValue({ results: [] });
+      const route = buildRoute([[600, 60]]);
+
+      await expect(calculateStops(TransportationType.CAR, route)).resolves.toEqual([]);
+      expect(searchService.searchPlaces).toHaveBeenCalledTimes(1);
+    });
+
+    it('should place stops along the geometry of a single-segment route', async () => {
+      // Like an OSRM route: one segment for the whole trip, 1000 km and 600 minutes,
+      // with path points one degree apart along a meridian (nine equal legs)
+      const route: IRoute = {
+        ...buildRoute([[1000, 600]]),
+        pathPoints: Array.from({ length: 10 }, (_, latitude) => [latitude, 0]),
+      };
+
+      const stops = await calculateStops(TransportationType.CAR, route);
+
+      expect(stops.map((stop) => [stop.type, stop.distanceFromStart])).toEqual([
+        ['rest', '333.3'],
+        ['fuel', '555.6'],
+        ['food', '555.6'],
+        ['rest', '666.7'],
+        ['rest', '1000.0'],
+        ['food', '1000.0'],
+      ]);
+      expect(stops[1]).toMatchObject({
+        location: { latitude: 5, longitude: 0 },
+        estimatedTime: '05:33',
+      });
+      expect(searchService.searchPlaces).toHaveBeenCalledWith(
+        expect.objectContaining({ query: 'gas station', latitude: 5, longitude: 0 }),
+      );
+    });
+  });
+});
@@ -2,15 +2,171 @@ import { Injectable, Logger } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import { BaseService } from './base.service';
 import { OSMRepository } from '../modules/repositories/maps/osm.repository';
-import { OpenWeatherRepository } from '../modules/repositories/weather/open-weather.repository';
+import {
+  IRouteWeather,
+  OpenWeatherRepository,
+} from '../modules/repositories/weather/open-weather.repository';
 import { SearchService } from './search.service';
 import { TravelRequestDto } from '../models/travel/travel-request.dto';
-import { TravelResponseDto } from '../models/travel/travel-response.dto';
+import { ITripHealth, TravelResponseDto } from '../models/travel/travel-response.dto';
+import { DEFAULT_RECOMMENDATIONS } from '../models/travel/default-recommendations.constant';
 import { RouteDto } from '../models/route/route.dto';
+import { RouteSegmentDto } from '../models/route/route-segment.dto';
+import { LocationDto } from '../models/location/location.dto';
 import { TransportCostsDto } from '../models/costs/transport-costs.dto';
 import { TransportationType } from '../models/travel/transportation-type.enum';
-import { IRoute } from '../modules/repositories/maps/base-maps.repository';
+import { getFuelPrice } from '../models/vehicle/fuel-prices.constant';
+import { CarSpecificationsDto } from '../models/vehicle/car-specifications.dto';
+import { MotorcycleSpecificationsDto } from '../models/vehicle/motorcycle-specifications.dto';
+import { IRoute, IRouteSegment } from '../modules/repositories/maps/base-maps.repository';
 import { ILocation } from '../modules/repositories/base.repository';
+import { SearchResultDto } from '../models/base/search-result.dto';
+import { calculateDistance, lowerBound, parseLatLng } from '../common/utils/helpers';
+
+// Calories burned per km per person for human-powered transport
+const CALORIES_PER_KM: Readonly<Partial<Record<TransportationType, number>>> = Object.freeze({
+  [TransportationType.WALKING]: 50,
+  [TransportationType.BICYCLE]: 30,
+});
+
+export type TravelPlanStage =
+  | 'route'
+  | 'costs'
+  | 'stops'
+  | 'health'
+  | 'weather'
+  | 'recommendations'
+  | 'metadata';
+
+/**
+ * Part of a streamed travel plan
+ */
+export interface TravelPlanEvent {
+  stage: TravelPlanStage;
+  data: any;
+}
+
+interface IVehicleDefaults {
+  label: string;
+  fuelConsumption: number; // L/100km
+  tankCapacity: number; // liters
+  getSpecs(
+    request: TravelRequestDto,
+  ): CarSpecificationsDto | MotorcycleSpecificationsDto | undefined;
+}
+
+// Fallback specs for motorized transport when the request leaves fields empty
+const VEHICLE_DEFAULTS: Readonly<Partial<Record<TransportationType, IVehicleDefaults>>> =
+  Object.freeze({
+    [TransportationType.CAR]: {
+      label: 'Car',
+      fuelConsumption: 8,
+      tankCapacity: 60,
+      getSpecs: (request) => request.carSpecifications,
+    },
+    [TransportationType.MOTORCYCLE]: {
+      label: 'Motorcycle',
+      fuelConsumption: 5,
+      tankCapacity: 15,
+      getSpecs: (request) => request.motorcycleSpecifications,
+    },
+  });
+
+// Vehicle assumed for cost estimates when the request carries no specifications;
+// shared read-only instead of rebuilt per calculation
+interface IVehicleCostSpecs {
+  fuelConsumption: number; // L/100km
+  fuelType: string;
+  tankCapacity: number; // liters
+  initialFuel: number; // liters
+}
+
+const DEFAULT_CAR_COST_SPECS: Readonly<IVehicleCostSpecs> = Object.freeze({
+  fuelConsumption: 7.5,
+  fuelType: 'gasoline',
+  tankCapacity: 60,
+  initialFuel: 60,
+});
+
+const DEFAULT_MOTORCYCLE_COST_SPECS: Readonly<IVehicleCostSpecs> = Object.freeze({
+  fuelConsumption: 4.0,
+  fuelType: 'gasoline',
+  tankCapacity: 15,
+  initialFuel: 15,
+});
+
+// OSRM routing profile per transport type; OSRM supports car, bike and foot only
+const OSRM_PROFILES: Readonly<Record<TransportationType, string>> = Object.freeze({
+  [TransportationType.CAR]: 'car',
+  [TransportationType.MOTORCYCLE]: 'car',
+  [TransportationType.BUS]: 'car',
+  [TransportationType.TRAIN]: 'car', // No transit in OSRM, use car as fallback
+  [TransportationType.WALKING]: 'foot',
+  [TransportationType.BICYCLE]: 'bike',
+  [TransportationType.FERRY]: 'car',
+  [TransportationType.PLANE]: 'car', // Not supported, use car as fallback
+});
+
+// Health summary for motorized trips, shared read-only instead of rebuilt per plan
+const NO_ACTIVITY_HEALTH: Readonly<ITripHealth> = Object.freeze({
+  totalCalories: 0,
+  activityBreakdown: Object.freeze({}),
+});
+
+// Intermediate route points sampled for en-route weather, on top of the endpoints
+const WEATHER_SAMPLE_POINTS = 3;
+
+// Stop planning rules; intervals are pre-converted to the route's units (km, minutes)
+const STOP_RULES = Object.freeze({
+  fuel: Object.freeze({ query: 'gas station', radius: 3000, defaultIntervalKm: 500 }),
+  rest: Object.freeze({
+    query: 'rest area',
+    radius: 2000,
+    intervalMinutes: 150,
+    durationMinutes: 20,
+  }),
+  food: Object.freeze({ query: 'restaurant', radius: 5000, intervalMinutes: 270 }),
+});
+
+/**
+ * Stop planned along the route, before looking up an actual place for it
+ */
+interface IStopCandidate {
+  type: 'fuel' | 'rest' | 'food';
+  query: string;
+  radius: number; // meters
+  location: ILocation;
+  distanceMeters: number; // numeric sort key
+  distanceFromStart: string; // km
+  estimatedTime: string;
+  duration: number | undefined; // minutes, rest stops only
+}
+
+/**
+ * Points where stops can be placed, in route order
+ */
+interface IStopAnchors {
+  distances: Float64Array; // cumulative meters
+  times: Float64Array; // cumulative minutes
+  locationAt(index: number): ILocation;
+}
+
+// Route -> DTO mappers, defined once instead of as per-call closures
+const toLocationDto = (location: ILocation): LocationDto => ({
+  latitude: location.latitude,
+  longitude: location.longitude,
+  address: location.address || '',
+  placeId: location.placeId || '',
+});
+
+const toRouteSegmentDto = (segment: IRouteSegment): RouteSegmentDto => ({
+  startLocation: toLocationDto(segment.startLocation),
+  endLocation: toLocationDto(segment.endLocation),
+  distance: segment.distance,
+  duration: segment.duration,
+  polyline: segment.polyline,
+  instructions: segment.instructions,
+});
 
 /**
  * Travel service - main business logic for travel planning
@@ -18,16 +174,6 @@ import { ILocation } from '../modules/repositories/base.repository';
  */
 @Injectable()
 export class TravelService extends BaseService {
-  // Default fuel prices (USD per liter)
-  private readonly FUEL_PRICES = {
-    gasoline: 1.5,
-    diesel: 1.4,
-    electric: 0.3, // per kWh equivalent
-    '92': 1.45,
-    '95': 1.5,
-    '98': 1.6,
-  };
-
   // Average food/water costs per person per hour
   private readonly FOOD_COST_PER_HOUR = 5; // USD
   private readonly WATER_COST_PER_HOUR = 2; // USD
@@ -48,23 +194,22 @@ export class TravelService extends BaseService {
     try {
       this.logger.log(`Planning travel from ${request.origin} to ${request.destination}`);
 
-      // Step 1: Get route from maps
-      const route = await this.getRoute(request);
-
-      // Step 2: Calculate transport costs
-      const transportCosts = await this.calculateTransportCosts(request, route);
-
-      // Step 3: Calculate stops if needed
-      const stops = await this.calculateStops(request, route);
-
-      // Step 4: Calculate calories for active transport
-      const health = await this.calculateCalories(request, route);
-
-      // Step 5: Get weather forecast for the route
-      const weather = await this.getWeatherForRoute(route);
-
-      // Step 6: Use AI to generate recommendations
-      const recommendations = await this.generateRecommendations(request, route, transportCosts);
+      // Stage 1: Get route from maps - everything else depends on it. Weather only
+      // needs the endpoints, so it is fetched while the route is being computed
+      const [origin, destination] = await this.geocodeEndpoints(request);
+      const endpointWeather = this.getWeatherForEndpoints(origin, destination);
+      const route = await this.getRoute(request, origin, destination);
+
+      // Stage 2: Costs, stops, calories and weather only depend on the route, so
+      // they all start at once; AI recommendations start as soon as costs are known
+      const costsPromise = this.calculateTransportCosts(request, route);
+      const [transportCosts, stops, health, weather, recommendations] = await Promise.all([
+        costsPromise,
+        this.calculateStops(request, route),
+        this.calculateCalories(request, route),
+        this.getWeatherForRoute(endpointWeather, route),
+        costsPromise.then((costs) => this.generateRecommendations(request, route, costs)),
+      ]);
 
       return {
         route: this.convertToRouteDto(route),
@@ -86,22 +231,87 @@ export class TravelService extends BaseService {
   }
 
   /**
-   * Get route between origin and destination
+   * Plan travel itinerary, yielding each part of the plan as soon as it is ready
+   * Route and costs come first; the remaining stages arrive in completion order
    */
-  private async getRoute(request: TravelRequestDto): Promise<IRoute> {
-    // Geocode origin and destination
-    const originLocation = await this.mapsRepository.geocode(request.origin);
-    const destLocation = await this.mapsRepository.geocode(request.destination);
+  async *planTravelStream(request: TravelRequestDto): AsyncGenerator<TravelPlanEvent> {
+    this.logger.log(`Streaming travel plan from ${request.origin} to ${request.destination}`);
+
+    const [origin, destination] = await this.geocodeEndpoints(request);
+    const endpointWeather = this.getWeatherForEndpoints(origin, destination);
+    const route = await this.getRoute(request, origin, destination);
+
+    // Start every route-dependent stage before the route and costs are yielded, so
+    // slow lookups overlap with the client consuming the first events
+    const costsPromise = this.calculateTransportCosts(request, route);
+    const pending = new Map<TravelPlanStage, Promise<TravelPlanEvent>>();
+    const track = (stage: TravelPlanStage, promise: Promise<any>) => {
+      const event = promise.then((data) => ({ stage, data }));
+      // Failures surface through the race below; don't report them as unhandled
+      // while the generator is suspended at an earlier yield
+      event.catch(() => undefined);
+      pending.set(stage, event);
+    };
 
+    track('stops', this.calculateStops(request, route));
+    track('health', this.calculateCalories(request, route));
+    track('weather', this.getWeatherForRoute(endpointWeather, route));
+    track(
+      'recommendations',
+      costsPromise.then((costs) => this.generateRecommendations(request, route, costs)),
+    );
+
+    yield { stage: 'route', data: this.convertToRouteDto(route) };
+    yield { stage: 'costs', data: await costsPromise };
+
+    while (pending.size > 0) {
+      const event = await Promise.race(pending.values());
+      pending.delete(event.stage);
+      yield event;
+    }
+
+    yield {
+      stage: 'metadata',
+      data: {
+        generatedAt: new Date().toISOString(),
+        transportationType: request.transportationType,
+        passengers: request.passengers || 1,
+      },
+    };
+  }
+
+  /**
+   * Geocode origin and destination concurrently - they are independent lookups
+   */
+  private geocodeEndpoints(request: TravelRequestDto): Promise<[ILocation, ILocation]> {
+    return Promise.all([this.geocode(request.origin), this.geocode(request.destination)]);
+  }
+
+  /**
+   * Get route between geocoded origin and destination
+   */
+  private getRoute(
+    request: TravelRequestDto,
+    origin: ILocation,
+    destination: ILocation,
+  ): Promise<IRoute> {
     // Determine mode based on transportation type
     const mode = this.getTravelMode(request.transportationType);
 
     // Get directions
-    return await this.mapsRepository.getDirections(
-      originLocation,
-      destLocation,
-      mode,
-    );
+    return this.mapsRepository.getDirections(origin, destination, mode);
+  }
+
+  /**
+   * Geocode a location, skipping the lookup when it is already a "lat,lng" pair
+   */
+  private async geocode(location: string): Promise<ILocation> {
+    const coordinates = parseLatLng(location);
+    if (coordinates) {
+      return { ...coordinates, address: location };
+    }
+
+    return this.mapsRepository.geocode(location);
   }
 
   /**
@@ -114,36 +324,38 @@ export class TravelService extends BaseService {
     const distanceKm = route.totalDistance / 1000;
     const durationHours = route.totalDuration / 60;
     const passengers = request.passengers || 1;
+    // Food and water costs all scale with person-hours on the road
+    const personHours = durationHours * passengers;
 
     const costs = new TransportCostsDto();
     costs.currency = 'USD';
 
     switch (request.transportationType) {
       case TransportationType.CAR:
-        return this.calculateCarCosts(request, distanceKm, durationHours, passengers);
+        return this.calculateCarCosts(request, distanceKm, personHours);
       
       case TransportationType.MOTORCYCLE:
-        return this.calculateMotorcycleCosts(request, distanceKm, durationHours, passengers);
+        return this.calculateMotorcycleCosts(request, distanceKm, personHours);
       
       case TransportationType.BUS:
         costs.totalCost = 30 * passengers; // Estimated bus ticket
         costs.ticketCost = 30 * passengers;
-        costs.foodCost = this.FOOD_COST_PER_HOUR * durationHours * passengers;
-        costs.waterCost = this.WATER_COST_PER_HOUR * durationHours * passengers;
+        costs.foodCost = this.FOOD_COST_PER_HOUR * personHours;
+        costs.waterCost = this.WATER_COST_PER_HOUR * personHours;
         break;
 
       case TransportationType.TRAIN:
         costs.totalCost = 50 * passengers; // Estimated train ticket
         costs.ticketCost = 50 * passengers;
-        costs.foodCost = this.FOOD_COST_PER_HOUR * durationHours * passengers;
-        costs.waterCost = this.WATER_COST_PER_HOUR * durationHours * passengers;
+        costs.foodCost = this.FOOD_COST_PER_HOUR * personHours;
+        costs.waterCost = this.WATER_COST_PER_HOUR * personHours;
         break;
 
       case TransportationType.WALKING:
       case TransportationType.BICYCLE:
         costs.totalCost = 0;
-        costs.foodCost = this.FOOD_COST_PER_HOUR * durationHours * passengers;
-        costs.waterCost = this.WATER_COST_PER_HOUR * durationHours * passengers;
+        costs.foodCost = this.FOOD_COST_PER_HOUR * personHours;
+        costs.waterCost = this.WATER_COST_PER_HOUR * personHours;
         break;
 
       default:
@@ -152,10 +364,10 @@ export class TravelService extends BaseService {
 
     // Add food and water if not already calculated
     if (!costs.foodCost) {
-      costs.foodCost = this.FOOD_COST_PER_HOUR * durationHours * passengers;
+      costs.foodCost = this.FOOD_COST_PER_HOUR * personHours;
     }
     if (!costs.waterCost) {
-      costs.waterCost = this.WATER_COST_PER_HOUR * durationHours * passengers;
+      costs.waterCost = this.WATER_COST_PER_HOUR * personHours;
     }
 
     costs.totalCost += (costs.foodCost || 0) + (costs.waterCost || 0);
@@ -169,15 +381,9 @@ export class TravelService extends BaseService {
   private async calculateCarCosts(
     request: TravelRequestDto,
     distanceKm: number,
-    durationHours: number,
-    passengers: number,
+    personHours: number,
   ): Promise<TransportCostsDto> {
-    const specs = request.carSpecifications || {
-      fuelConsumption: 7.5,
-      fuelType: 'gasoline',
-      tankCapacity: 60,
-      initialFuel: 60,
-    };
+    const specs = request.carSpecifications || DEFAULT_CAR_COST_SPECS;
 
     const fuelConsumption = specs.fuelConsumption || 7.5;
     const fuelType = specs.fuelType || 'gasoline';
@@ -185,7 +391,7 @@ export class TravelService extends BaseService {
     const initialFuel = specs.initialFuel || tankCapacity;
 
     const fuelNeeded = (fuelConsumption * distanceKm) / 100;
-    const fuelPrice = this.FUEL_PRICES[fuelType as keyof typeof this.FUEL_PRICES] || 1.5;
+    const fuelPrice = getFuelPrice(fuelType);
     const fuelCost = fuelNeeded * fuelPrice;
 
     // Calculate refueling stops needed
@@ -199,8 +405,8 @@ export class TravelService extends BaseService {
     const costs = new TransportCostsDto();
     costs.currency = 'USD';
     costs.fuelCost = fuelCost;
-    costs.foodCost = this.FOOD_COST_PER_HOUR * durationHours * passengers;
-    costs.waterCost = this.WATER_COST_PER_HOUR * durationHours * passengers;
+    costs.foodCost = this.FOOD_COST_PER_HOUR * personHours;
+    costs.waterCost = this.WATER_COST_PER_HOUR * personHours;
     costs.maintenanceCost = maintenanceCost;
     costs.refuelingStops = refuelingStops;
     costs.totalCost = fuelCost + maintenanceCost + costs.foodCost + costs.waterCost;
@@ -214,18 +420,12 @@ export class TravelService extends BaseService {
   private async calculateMotorcycleCosts(
     request: TravelRequestDto,
     distanceKm: number,
-    durationHours: number,
-    passengers: number,
+    personHours: number,
   ): Promise<TransportCostsDto> {
-    const specs = request.motorcycleSpecifications || {
-      fuelConsumption: 4.0, // L/100km
-      fuelType: 'gasoline',
-      tankCapacity: 15,
-      initialFuel: 15,
-    };
+    const specs = request.motorcycleSpecifications || DEFAULT_MOTORCYCLE_COST_SPECS;
 
     const fuelNeeded = (specs.fuelConsumption * distanceKm) / 100;
-    const fuelPrice = this.FUEL_PRICES[specs.fuelType as keyof typeof this.FUEL_PRICES] || 1.5;
+    const fuelPrice = getFuelPrice(specs.fuelType);
     const fuelCost = fuelNeeded * fuelPrice;
 
     // Calculate refueling stops needed
@@ -239,8 +439,8 @@ export class TravelService extends BaseService {
     const costs = new TransportCostsDto();
     costs.currency = 'USD';
     costs.fuelCost = fuelCost;
-    costs.foodCost = this.FOOD_COST_PER_HOUR * durationHours * passengers;
-    costs.waterCost = this.WATER_COST_PER_HOUR * durationHours * passengers;
+    costs.foodCost = this.FOOD_COST_PER_HOUR * personHours;
+    costs.waterCost = this.WATER_COST_PER_HOUR * personHours;
     costs.maintenanceCost = maintenanceCost;
     costs.refuelingStops = refuelingStops;
     costs.totalCost = fuelCost + maintenanceCost + costs.foodCost + costs.waterCost;
@@ -249,144 +449,214 @@ export class TravelService extends BaseService {
   }
 
   /**
-   * Calculate recommended stops for the route based on segments
+   * Calculate recommended stops along the route
    */
   private async calculateStops(
     request: TravelRequestDto,
     route: IRoute,
   ): Promise<any[]> {
-    const stops = [];
-    const distanceKm = route.totalDistance / 1000;
-    const durationHours = route.totalDuration / 60;
+    // Nothing to plan for an empty or zero-length route
+    if (route.segments.length === 0 || route.totalDistance <= 0) {
+      return [];
+    }
+
+    const candidates: IStopCandidate[] = [];
 
     // Calculate fuel stops based on vehicle type and tank capacity
-    let fuelStopInterval = 500; // km, default
-    if (request.transportationType === TransportationType.CAR && request.carSpecifications) {
-      const tankCapacity = request.carSpecifications.tankCapacity || 60;
-      const fuelConsumption = request.carSpecifications.fuelConsumption || 8;
-      fuelStopInterval = Math.floor((tankCapacity / fuelConsumption) * 100);
-    } else if (request.transportationType === TransportationType.MOTORCYCLE && request.motorcycleSpecifications) {
-      const tankCapacity = request.motorcycleSpecifications.tankCapacity || 15;
-      const fuelConsumption = request.motorcycleSpecifications.fuelConsumption || 5;
+    let fuelStopInterval = STOP_RULES.fuel.defaultIntervalKm;
+    const vehicle = VEHICLE_DEFAULTS[request.transportationType];
+    const specs = vehicle?.getSpecs(request);
+    if (specs) {
+      const tankCapacity = specs.tankCapacity || vehicle.tankCapacity;
+      const fuelConsumption = specs.fuelConsumption || vehicle.fuelConsumption;
       fuelStopInterval = Math.floor((tankCapacity / fuelConsumption) * 100);
     }
 
-    // Calculate rest stops (every 2-3 hours or 200km)
-    const restStopIntervalHours = 2.5;
-    const restStopIntervalKm = 200;
-
-    let accumulatedDistance = 0;
-    let accumulatedTime = 0;
-    let distanceSinceLastFuelStop = 0;
-    let timeSinceLastRestStop = 0;
-
-    for (const segment of route.segments) {
-      accumulatedDistance += segment.distance;
-      accumulatedTime += segment.duration;
-      distanceSinceLastFuelStop += segment.distance;
-      timeSinceLastRestStop += segment.duration;
-
-      const accumulatedDistanceKm = accumulatedDistance / 1000;
-      const distanceSinceFuelKm = distanceSinceLastFuelStop / 1000;
-      const timeSinceRestHours = timeSinceLastRestStop / 60;
-
-      // Check for fuel stop needed
-      if (distanceSinceFuelKm >= fuelStopInterval && 
-          (request.transportationType === TransportationType.CAR || 
-           request.transportationType === TransportationType.MOTORCYCLE)) {
-        
-        const gasStations = await this.searchService.searchPlaces({
-          query: 'gas station',
-          latitude: segment.endLocation.latitude,
-          longitude: segment.endLocation.longitude,
-          radius: 3000,
+    // Cumulative distance and time at every point a stop can be placed, built once
+    // and shared by the fuel, rest and food stop planning below
+    const anchors = this.getStopAnchors(route);
+    const { distances, times } = anchors;
+    const anchorCount = distances.length;
+
+    // Fuel stops for motorized transport: each one is due a full tank range after the
+    // previous one, so jump straight to it with a binary search over cumulative distance
+    if (vehicle) {
+      const fuelStopIntervalMeters = fuelStopInterval * 1000;
+      let index = lowerBound(distances, fuelStopIntervalMeters);
+
+      while (index < anchorCount) {
+        candidates.push({
+          type: 'fuel',
+          query: STOP_RULES.fuel.query,
+          radius: STOP_RULES.fuel.radius,
+          location: anchors.locationAt(index),
+          distanceMeters: distances[index],
+          distanceFromStart: (distances[index] / 1000).toFixed(1),
+          estimatedTime: this.formatTime(times[index]),
+          duration: undefined,
         });
 
-        if (gasStations.results.length > 0) {
-          stops.push({
-            type: 'fuel',
-            location: {
-              latitude: segment.endLocation.latitude,
-              longitude: segment.endLocation.longitude,
-              address: segment.endLocation.address,
-            },
-            distanceFromStart: accumulatedDistanceKm.toFixed(1),
-            estimatedTime: this.formatTime(accumulatedTime),
-            placeDetails: gasStations.results[0],
-          });
-          distanceSinceLastFuelStop = 0;
-        }
+        index = Math.max(
+          lowerBound(distances, distances[index] + fuelStopIntervalMeters),
+          index + 1,
+        );
       }
+    }
 
-      // Check for rest stop needed
-      if (timeSinceRestHours >= restStopIntervalHours) {
-        const restAreas = await this.searchService.searchPlaces({
-          query: 'rest area',
-          latitude: segment.endLocation.latitude,
-          longitude: segment.endLocation.longitude,
-          radius: 2000,
-        });
-
-        if (restAreas.results.length > 0) {
-          stops.push({
-            type: 'rest',
-            location: {
-              latitude: segment.endLocation.latitude,
-              longitude: segment.endLocation.longitude,
-              address: segment.endLocation.address,
-            },
-            distanceFromStart: accumulatedDistanceKm.toFixed(1),
-            estimatedTime: this.formatTime(accumulatedTime),
-            duration: 20,
-            placeDetails: restAreas.results[0],
-          });
-          timeSinceLastRestStop = 0;
-        }
-      }
+    // Rest stops every 2.5 hours of travel: binary search over cumulative time for the
+    // point that crosses each threshold instead of visiting every point
+    let restIndex = lowerBound(times, STOP_RULES.rest.intervalMinutes);
+
+    while (restIndex < anchorCount) {
+      candidates.push({
+        type: 'rest',
+        query: STOP_RULES.rest.query,
+        radius: STOP_RULES.rest.radius,
+        location: anchors.locationAt(restIndex),
+        distanceMeters: distances[restIndex],
+        distanceFromStart: (distances[restIndex] / 1000).toFixed(1),
+        estimatedTime: this.formatTime(times[restIndex]),
+        duration: STOP_RULES.rest.durationMinutes,
+      });
+
+      restIndex = lowerBound(times, times[restIndex] + STOP_RULES.rest.intervalMinutes);
     }
 
     // Add food stops near major cities (every 4-5 hours)
-    const foodInterval = 4.5;
-    const numFoodStops = Math.floor(durationHours / foodInterval);
-    
+    const numFoodStops = Math.floor(route.totalDuration / STOP_RULES.food.intervalMinutes);
+    const foodStopSpacing = route.totalDuration / numFoodStops;
+
     for (let i = 1; i <= numFoodStops; i++) {
-      const targetTime = (durationHours * i / numFoodStops) * 60;
-      let currentTime = 0;
-      
-      for (const segment of route.segments) {
-        currentTime += segment.duration;
-        if (currentTime >= targetTime) {
-          const restaurants = await this.searchService.searchPlaces({
-            query: 'restaurant',
-            latitude: segment.endLocation.latitude,
-            longitude: segment.endLocation.longitude,
-            radius: 5000,
-          });
+      const targetTime = foodStopSpacing * i;
+      const index = lowerBound(times, targetTime);
+
+      if (index < anchorCount) {
+        candidates.push({
+          type: 'food',
+          query: STOP_RULES.food.query,
+          radius: STOP_RULES.food.radius,
+          location: anchors.locationAt(index),
+          distanceMeters: distances[index],
+          distanceFromStart: (distances[index] / 1000).toFixed(1),
+          estimatedTime: this.formatTime(times[index]),
+          duration: undefined,
+        });
+      }
+    }
 
-          if (restaurants.results.length > 0) {
-            stops.push({
-              type: 'food',
-              location: {
-                latitude: segment.endLocation.latitude,
-                longitude: segment.endLocation.longitude,
-                address: segment.endLocation.address,
-              },
-              distanceFromStart: (segment.distance / 1000).toFixed(1),
-              estimatedTime: this.formatTime(currentTime),
-              placeDetails: restaurants.results[0],
-            });
-          }
-          break;
+    // Order by distance from start on the numeric key; the lookups below keep this order
+    candidates.sort((a, b) => a.distanceMeters - b.distanceMeters);
+
+    // Look up every distinct (query, location, radius) only once and run the
+    // lookups concurrently instead of awaiting one search per stop
+    const lookups = new Map<string, Promise<SearchResultDto>>();
+    const places = await Promise.all(
+      candidates.map((candidate) => {
+        const { latitude, longitude } = candidate.location;
+        const key = `${candidate.query}|${latitude}|${longitude}|${candidate.radius}`;
+
+        let lookup = lookups.get(key);
+        if (!lookup) {
+          lookup = this.searchService.searchPlaces({
+            query: candidate.query,
+            latitude,
+            longitude,
+            radius: candidate.radius,
+            // Only the best match is used for each stop
+            limit: 1,
+          });
+          lookups.set(key, lookup);
         }
+
+        return lookup;
+      }),
+    );
+
+    const stops = [];
+    candidates.forEach((candidate, index) => {
+      const results = places[index].results;
+      if (results.length === 0) {
+        return;
       }
-    }
 
-    // Sort stops by distance from start
-    stops.sort((a, b) => parseFloat(a.distanceFromStart) - parseFloat(b.distanceFromStart));
+      const { location } = candidate;
+      stops.push({
+        type: candidate.type,
+        location: {
+          latitude: location.latitude,
+          longitude: location.longitude,
+          address: location.address,
+        },
+        distanceFromStart: candidate.distanceFromStart,
+        estimatedTime: candidate.estimatedTime,
+        // Always set (undefined is omitted from JSON) so every stop shares one shape
+        duration: candidate.duration,
+        placeDetails: results[0],
+      });
+    });
 
     return stops;
   }
 
+  /**
+   * Stop anchors along the route geometry, or at segment ends without one
+   * OSRM returns the whole trip as a single segment, so its geometry is what lets
+   * stops fall along the way instead of all at the destination
+   */
+  private getStopAnchors(route: IRoute): IStopAnchors {
+    const { pathPoints, segments } = route;
+
+    if (pathPoints.length < 2) {
+      const distances = new Float64Array(segments.length);
+      const times = new Float64Array(segments.length);
+      let covered = 0;
+      let elapsed = 0;
+      segments.forEach((segment, index) => {
+        covered += segment.distance;
+        elapsed += segment.duration;
+        distances[index] = covered;
+        times[index] = elapsed;
+      });
+
+      return { distances, times, locationAt: (index) => segments[index].endLocation };
+    }
+
+    // One anchor per point after the origin
+    const count = pathPoints.length - 1;
+    const distances = new Float64Array(count);
+    let covered = 0;
+    for (let i = 0; i < count; i++) {
+      const [fromLatitude, fromLongitude] = pathPoints[i];
+      const [toLatitude, toLongitude] = pathPoints[i + 1];
+      covered += calculateDistance(fromLatitude, fromLongitude, toLatitude, toLongitude);
+      distances[i] = covered;
+    }
+
+    // Straight lines between points fall a little short of the road distance, so
+    // scale them to the route's totals; time is spread in proportion to distance
+    const distanceScale = covered > 0 ? route.totalDistance / covered : 0;
+    const minutesPerMeter = route.totalDuration / route.totalDistance;
+    const times = new Float64Array(count);
+    for (let i = 0; i < count; i++) {
+      distances[i] *= distanceScale;
+      times[i] = distances[i] * minutesPerMeter;
+    }
+    // Pin the end to the exact totals so rounding cannot drop a stop due at arrival
+    if (covered > 0) {
+      distances[count - 1] = route.totalDistance;
+      times[count - 1] = route.totalDuration;
+    }
+
+    return {
+      distances,
+      times,
+      locationAt: (index) => {
+        const [latitude, longitude] = pathPoints[index + 1];
+        return { latitude, longitude };
+      },
+    };
+  }
+
   /**
    * Format minutes to HH:MM
    */
@@ -402,24 +672,14 @@ export class TravelService extends BaseService {
   private async calculateCalories(
     request: TravelRequestDto,
     route: IRoute,
-  ): Promise<any> {
+  ): Promise<ITripHealth> {
     const distanceKm = route.totalDistance / 1000;
     const passengers = request.passengers || 1;
 
-    let caloriesPerKm = 0;
+    const caloriesPerKm = CALORIES_PER_KM[request.transportationType];
 
-    switch (request.transportationType) {
-      case TransportationType.WALKING:
-        caloriesPerKm = 50; // calories per km walking
-        break;
-      case TransportationType.BICYCLE:
-        caloriesPerKm = 30; // calories per km cycling
-        break;
-      default:
-        return {
-          totalCalories: 0,
-          activityBreakdown: {},
-        };
+    if (!caloriesPerKm) {
+      return NO_ACTIVITY_HEALTH;
     }
 
     const totalCalories = Math.round(caloriesPerKm * distanceKm * passengers);
@@ -433,31 +693,22 @@ export class TravelService extends BaseService {
   }
 
   /**
-   * Get weather forecast for the route
+   * Get current weather at the trip origin and destination
    */
-  private async getWeatherForRoute(route: IRoute): Promise<any> {
+  private async getWeatherForEndpoints(
+    origin: ILocation,
+    destination: ILocation,
+  ): Promise<IRouteWeather | null> {
     try {
-      // Get weather for start and end points
-      if (route.segments.length > 0) {
-        const startSegment = route.segments[0];
-        const endSegment = route.segments[route.segments.length - 1];
-
-        const [startWeather, endWeather] = await Promise.all([
-          this.weatherRepository.getCurrentWeather(
-            startSegment.startLocation.latitude,
-            startSegment.startLocation.longitude,
-          ),
-          this.weatherRepository.getCurrentWeather(
-            endSegment.endLocation.latitude,
-            endSegment.endLocation.longitude,
-          ),
-        ]);
-
-        return {
-          origin: startWeather,
-          destination: endWeather,
-        };
-      }
+      const [originWeather, destinationWeather] = await Promise.all([
+        this.weatherRepository.getCurrentWeather(origin.latitude, origin.longitude),
+        this.weatherRepository.getCurrentWeather(destination.latitude, destination.longitude),
+      ]);
+
+      return {
+        origin: originWeather,
+        destination: destinationWeather,
+      };
     } catch (error) {
       this.logger.warn(`Weather fetch failed: ${error.message}`);
     }
@@ -465,6 +716,37 @@ export class TravelService extends BaseService {
     return null;
   }
 
+  /**
+   * Add weather at evenly spaced points along the route to the endpoint weather
+   * All points are fetched concurrently, so this costs about one request of latency
+   */
+  private async getWeatherForRoute(
+    endpointWeather: Promise<IRouteWeather | null>,
+    route: IRoute,
+  ): Promise<IRouteWeather | null> {
+    const { pathPoints } = route;
+    const step = pathPoints.length / (WEATHER_SAMPLE_POINTS + 1);
+    const samples: number[][] = [];
+    if (step >= 1) {
+      for (let i = 1; i <= WEATHER_SAMPLE_POINTS; i++) {
+        samples.push(pathPoints[Math.floor(step * i)]);
+      }
+    }
+
+    const waypointWeather = Promise.all(
+      samples.map(([latitude, longitude]) =>
+        this.weatherRepository.getCurrentWeather(latitude, longitude),
+      ),
+    ).catch((error) => {
+      this.logger.warn(`En-route weather fetch failed: ${error.message}`);
+      return [];
+    });
+
+    const [weather, waypoints] = await Promise.all([endpointWeather, waypointWeather]);
+
+    return weather && { ...weather, waypoints };
+  }
+
   /**
    * Generate AI-powered recommendations for the trip with specific route points
    */
@@ -473,6 +755,11 @@ export class TravelService extends BaseService {
     route: IRoute,
     costs: TransportCostsDto,
   ): Promise<string[]> {
+    // Without an LLM client there is nothing to ask, so skip building the prompt
+    if (!this.llm) {
+      return DEFAULT_RECOMMENDATIONS.slice();
+    }
+
     try {
       const distanceKm = route.totalDistance / 1000;
       const durationHours = route.totalDuration / 60;
@@ -494,23 +781,16 @@ export class TravelService extends BaseService {
 
       // Build vehicle info
       let vehicleInfo = '';
-      if (request.transportationType === TransportationType.CAR && request.carSpecifications) {
-        const specs = request.carSpecifications;
+      const vehicle = VEHICLE_DEFAULTS[request.transportationType];
+      const specs = vehicle?.getSpecs(request);
+      if (specs) {
+        const tankCapacity = specs.tankCapacity || vehicle.tankCapacity;
         vehicleInfo = `
-        Vehicle: Car (${specs.model || 'N/A'})
+        Vehicle: ${vehicle.label} (${specs.model || 'N/A'})
         Fuel type: ${specs.fuelType || 'gasoline'}
-        Fuel consumption: ${specs.fuelConsumption || 8} L/100km
-        Tank capacity: ${specs.tankCapacity || 60} L
-        Initial fuel: ${specs.initialFuel || specs.tankCapacity || 60} L
-        `;
-      } else if (request.transportationType === TransportationType.MOTORCYCLE && request.motorcycleSpecifications) {
-        const specs = request.motorcycleSpecifications;
-        vehicleInfo = `
-        Vehicle: Motorcycle (${specs.model || 'N/A'})
-        Fuel type: ${specs.fuelType || 'gasoline'}
-        Fuel consumption: ${specs.fuelConsumption || 5} L/100km
-        Tank capacity: ${specs.tankCapacity || 15} L
-        Initial fuel: ${specs.initialFuel || specs.tankCapacity || 15} L
+        Fuel consumption: ${specs.fuelConsumption || vehicle.fuelConsumption} L/100km
+        Tank capacity: ${tankCapacity} L
+        Initial fuel: ${specs.initialFuel || tankCapacity} L
         `;
       }
 
@@ -540,11 +820,7 @@ export class TravelService extends BaseService {
       return Array.isArray(response) ? response : [];
     } catch (error) {
       this.logger.warn(`Recommendations generation failed: ${error.message}`);
-      return [
-        'Take regular breaks every 2 hours',
-        'Check weather conditions before departure',
-        'Keep emergency contacts handy',
-      ];
+      return DEFAULT_RECOMMENDATIONS.slice();
     }
   }
 
@@ -553,18 +829,7 @@ export class TravelService extends BaseService {
    * OSRM supports: car, bike, foot
    */
   private getTravelMode(transportType: TransportationType): string {
-    const modeMap: Record<TransportationType, string> = {
-      [TransportationType.CAR]: 'car',
-      [TransportationType.MOTORCYCLE]: 'car',
-      [TransportationType.BUS]: 'car',
-      [TransportationType.TRAIN]: 'car', // No transit in OSRM, use car as fallback
-      [TransportationType.WALKING]: 'foot',
-      [TransportationType.BICYCLE]: 'bike',
-      [TransportationType.FERRY]: 'car',
-      [TransportationType.PLANE]: 'car', // Not supported, use car as fallback
-    };
-
-    return modeMap[transportType] || 'car';
+    return OSRM_PROFILES[transportType] || 'car';
   }
 
   /**
@@ -572,24 +837,7 @@ export class TravelService extends BaseService {
    */
   private convertToRouteDto(route: IRoute): RouteDto {
     return {
-      segments: route.segments.map((segment) => ({
-        startLocation: {
-          latitude: segment.startLocation.latitude,
-          longitude: segment.startLocation.longitude,
-          address: segment.startLocation.address || '',
-          placeId: segment.startLocation.placeId || '',
-        },
-        endLocation: {
-          latitude: segment.endLocation.latitude,
-          longitude: segment.endLocation.longitude,
-          address: segment.endLocation.address || '',
-          placeId: segment.endLocation.placeId || '',
-        },
-        distance: segment.distance,
-        duration: segment.duration,
-        polyline: segment.polyline,
-        instructions: segment.instructions,
-      })),
+      segments: route.segments.map(toRouteSegmentDto),
       totalDistance: route.totalDistance,
       totalDuration: route.totalDuration,
       pathPoints: route.pathPoints,
@@ -1,8 +1,9 @@
 import { Test, TestingModule } from '@nestjs/testing';
-import { INestApplication, ValidationPipe } from '@nestjs/common';
+import { INestApplication } from '@nestjs/common';
 import * as request from 'supertest';
-import { MapsModule } from '../../wayfare/src/modules/maps/maps.module';
+import { MapsModule } from '../../src/modules/maps/maps.module';
 import { ConfigModule } from '@nestjs/config';
+import { createValidationPipe } from '../../src/common/pipes/validation.pipe';
 
 describe('Maps API (e2e)', () => {
   let app: INestApplication;
@@ -16,7 +17,7 @@ describe('Maps API (e2e)', () => {
     }).compile();
 
     app = moduleFixture.createNestApplication();
-    app.useGlobalPipes(new ValidationPipe());
+    app.useGlobalPipes(createValidationPipe());
     await app.init();
   });
 